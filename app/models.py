@@ -145,7 +145,8 @@ class Site(db.Model):
     geo = db.relationship('Geo', back_populates='sites')
     vertical = db.relationship('Vertical', back_populates='sites')
     domain = db.relationship('Domain', back_populates='site', foreign_keys=[domain_id])
-    site_brands = db.relationship('SiteBrand', back_populates='site', cascade='all, delete-orphan')
+    site_brands = db.relationship('SiteBrand', back_populates='site', cascade='all, delete-orphan',
+                                  order_by='SiteBrand.rank')
     site_pages = db.relationship('SitePage', back_populates='site', cascade='all, delete-orphan')
 
 
@@ -11,7 +11,7 @@ from ..models import (
     PageType, Domain, ContentHistory, CTATable, CTATableRow,
 )
 from ..services.content_generator import start_generation, generate_page_content, save_content_to_page, generate_meta_tags
-from ..services.site_builder import build_site
+from ..services.site_builder import build_site, load_site_for_build
 from ..services.deployer import deploy_site, rollback_site
 
 bp = Blueprint('sites', __name__, url_prefix='/sites')
@@ -299,6 +299,7 @@ def build(site_id):
         site.status = 'building'
         db.session.commit()
 
+        site = load_site_for_build(site.id)
         version_dir = build_site(site, output_dir, upload_folder)
 
         site.current_version += 1
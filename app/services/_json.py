@@ -0,0 +1,43 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speed-up for the per-page content_json loops;
+without it these fall back to the stdlib json module. Decode errors
+raised by orjson subclass json.JSONDecodeError, so callers can keep
+catching the stdlib exception.
+"""
+
+import json
+from json.encoder import encode_basestring
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj):
+        """Serialise obj to a JSON str."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    def encode_str(s):
+        """JSON string literal for s, keeping non-ASCII characters as-is.
+
+        Faster than the stdlib escaper for long text, slower for short
+        strings, so use it for long free-text values only.
+        """
+        try:
+            return orjson.dumps(s).decode('utf-8')
+        except TypeError:
+            # orjson rejects lone surrogates; the stdlib passes them through
+            return encode_basestring(s)
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        """Serialise obj to a JSON str."""
+        return json.dumps(obj)
+
+    encode_str = encode_basestring
@@ -6,6 +6,7 @@ Free tier: 100 requests/day. Each match uses ~3 additional requests
 
 import logging
 import os
+import threading
 from datetime import datetime, timedelta
 
 import requests
@@ -31,19 +32,22 @@ class APIFootballClient:
             os.getenv('TIPS_MAX_MATCHES_PER_DAY', str(DEFAULT_MAX_MATCHES))
         )
         self._request_count = 0
+        # The tips pipeline calls one client from several worker threads
+        self._count_lock = threading.Lock()
         self.headers = {
             'x-apisports-key': self.api_key,
         }
 
     def _get(self, endpoint, params=None):
         """Make a rate-limited GET request."""
-        if self._request_count >= 100:
-            logger.warning('API-Football daily request limit reached (100)')
-            raise RateLimitError('Daily API limit reached')
+        with self._count_lock:
+            if self._request_count >= 100:
+                logger.warning('API-Football daily request limit reached (100)')
+                raise RateLimitError('Daily API limit reached')
+            self._request_count += 1
 
         url = f'{API_BASE}/{endpoint}'
         resp = requests.get(url, headers=self.headers, params=params, timeout=15)
-        self._request_count += 1
 
         resp.raise_for_status()
         data = resp.json()
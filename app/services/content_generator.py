@@ -178,6 +178,135 @@ Write naturally in {language}. Use {currency} for monetary references. Be analyt
 }
 
 
+# --- Structured Output Schemas ---
+#
+# JSON Schemas mirroring PROMPT_TEMPLATES, sent as response_format=json_schema
+# with strict=True so the API constrains decoding to the expected shape.
+# Strict mode requires every property to be listed in "required" and
+# additionalProperties to be false on every object.
+
+def _strict_object(properties):
+    """Build a strict-mode JSON Schema object from a {name: schema} dict."""
+    return {
+        'type': 'object',
+        'properties': properties,
+        'required': list(properties),
+        'additionalProperties': False,
+    }
+
+
+def _array_of(items):
+    return {'type': 'array', 'items': items}
+
+
+_STR = {'type': 'string'}
+_NUM = {'type': 'number'}
+_STR_LIST = _array_of(_STR)
+_FAQ_LIST = _array_of(_strict_object({'question': _STR, 'answer': _STR}))
+_SECTION_LIST = _array_of(_strict_object({'heading': _STR, 'content': _STR}))
+
+PAGE_TYPE_SCHEMAS = {
+    'homepage': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'hero_stats': _array_of(_strict_object({'number': _STR, 'label': _STR})),
+        'trust_items': _STR_LIST,
+        'section_title': _STR,
+        'section_subtitle': _STR,
+        'top_brands': _array_of(_strict_object({
+            'name': _STR, 'slug': _STR, 'bonus': _STR, 'rating': _NUM,
+            'selling_points': _STR_LIST, 'feature_badges': _STR_LIST,
+        })),
+        'why_trust_us': _STR,
+        'faq': _FAQ_LIST,
+        'closing_paragraph': _STR,
+    }),
+    'comparison': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+        'comparison_rows': _array_of(_strict_object({
+            'brand': _STR, 'slug': _STR, 'bonus': _STR, 'rating': _NUM,
+            'pros': _STR_LIST, 'cons': _STR_LIST, 'verdict': _STR,
+            'feature_badges': _STR_LIST,
+        })),
+        'faq': _FAQ_LIST,
+        'closing_paragraph': _STR,
+    }),
+    'brand-review': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraphs': _STR_LIST,
+        'pros': _STR_LIST,
+        'cons': _STR_LIST,
+        'features_sections': _SECTION_LIST,
+        'verdict': _STR,
+        'faq': _FAQ_LIST,
+    }),
+    'bonus-review': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'bonus_overview': _strict_object({
+            'offer': _STR, 'code': _STR, 'min_deposit': _STR,
+            'wagering_requirements': _STR, 'validity': _STR,
+        }),
+        'how_to_claim': _STR_LIST,
+        'terms_summary': _STR,
+        'pros': _STR_LIST,
+        'cons': _STR_LIST,
+        'similar_offers': _STR,
+        'verdict': _STR,
+        'faq': _FAQ_LIST,
+    }),
+    'evergreen': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+        'sections': _SECTION_LIST,
+        'key_takeaways': _STR_LIST,
+        'faq': _FAQ_LIST,
+        'closing_paragraph': _STR,
+    }),
+    'news': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+    }),
+    'news-article': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+        'sections': _SECTION_LIST,
+        'key_takeaways': _STR_LIST,
+        'faq': _FAQ_LIST,
+        'closing_paragraph': _STR,
+    }),
+    'tips': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+    }),
+    'tips-article': _strict_object({
+        'hero_title': _STR,
+        'hero_subtitle': _STR,
+        'intro_paragraph': _STR,
+        'match_info': _strict_object({
+            'date': _STR, 'venue': _STR, 'competition': _STR, 'round': _STR,
+        }),
+        'sections': _SECTION_LIST,
+        'prediction': _strict_object({
+            'result': _STR, 'confidence': _STR, 'reasoning': _STR,
+        }),
+        'betting_tips': _array_of(_strict_object({
+            'market': _STR, 'selection': _STR, 'odds': _STR, 'reasoning': _STR,
+        })),
+        'key_stats': _STR_LIST,
+        'faq': _FAQ_LIST,
+        'closing_paragraph': _STR,
+    }),
+}
+
+
 def build_prompt(page_type_slug, geo, vertical, brands=None, brand=None,
                  brand_geo=None, evergreen_topic=None, match_data=None):
     """Construct the LLM prompt for a given page type and context."""
@@ -211,13 +340,32 @@ def build_prompt(page_type_slug, geo, vertical, brands=None, brand=None,
 MODEL_MAX_TOKENS = {
     'gpt-4o-mini': 16384,
     'gpt-4o': 16384,
+    'gpt-4.1-nano': 32768,
 }
 DEFAULT_MAX_TOKENS = 16384
 
+# Cheaper/faster model tiers for short, tightly-structured page types.
+# Page types not listed here use the configured model.
+PAGE_TYPE_MODEL = {
+    'bonus-review': 'gpt-4.1-nano',
+    'news': 'gpt-4.1-nano',
+    'tips': 'gpt-4.1-nano',
+}
+
+
+def model_for_page_type(page_type_slug, default_model):
+    """Return the model to use for a page type, falling back to default_model."""
+    return PAGE_TYPE_MODEL.get(page_type_slug, default_model)
 
-def call_openai(prompt, api_key, model='gpt-4o-mini', max_retries=2, max_tokens=8192):
+
+def call_openai(prompt, api_key, model='gpt-4o-mini', max_retries=2, max_tokens=8192,
+                schema=None, schema_name='content'):
     """Call the OpenAI API and return parsed JSON content.
 
+    If schema is given, the response is constrained with
+    response_format=json_schema (strict); otherwise free-form json_object
+    mode is used.
+
     Retries on JSON parse failures up to max_retries times.
     On finish_reason=length (truncated output), doubles max_tokens for the retry,
     capped at the model's maximum output token limit.
@@ -226,6 +374,14 @@ def call_openai(prompt, api_key, model='gpt-4o-mini', max_retries=2, max_tokens=
     model_cap = MODEL_MAX_TOKENS.get(model, DEFAULT_MAX_TOKENS)
     current_max_tokens = min(max_tokens, model_cap)
 
+    if schema:
+        response_format = {
+            'type': 'json_schema',
+            'json_schema': {'name': schema_name, 'schema': schema, 'strict': True},
+        }
+    else:
+        response_format = {'type': 'json_object'}
+
     for attempt in range(1, max_retries + 2):
         logger.info('Calling OpenAI API (model=%s, attempt %d, max_tokens=%d)', model, attempt, current_max_tokens)
         response = client.chat.completions.create(
@@ -234,7 +390,7 @@ def call_openai(prompt, api_key, model='gpt-4o-mini', max_retries=2, max_tokens=
                 {'role': 'system', 'content': 'You are a content writer. Always respond with valid JSON only, no markdown formatting.'},
                 {'role': 'user', 'content': prompt},
             ],
-            response_format={'type': 'json_object'},
+            response_format=response_format,
             temperature=0.7,
             max_tokens=current_max_tokens,
         )
@@ -285,7 +441,10 @@ def generate_page_content(site_page, site, api_key, model='gpt-4o-mini'):
         evergreen_topic=evergreen_topic,
     )
 
-    return call_openai(prompt, api_key, model), prompt
+    return call_openai(
+        prompt, api_key, model_for_page_type(page_type_slug, model),
+        schema=PAGE_TYPE_SCHEMAS.get(page_type_slug), schema_name=page_type_slug,
+    ), prompt
 
 
 def save_content_to_page(site_page, content_json_data, session):
@@ -352,7 +511,10 @@ def generate_page_content_with_notes(site_page, site, api_key, model='gpt-4o-min
     if site_page.regeneration_notes:
         prompt += f"\n\nAdditional instructions:\n{site_page.regeneration_notes}"
 
-    return call_openai(prompt, api_key, model), prompt
+    return call_openai(
+        prompt, api_key, model_for_page_type(page_type_slug, model),
+        schema=PAGE_TYPE_SCHEMAS.get(page_type_slug), schema_name=page_type_slug,
+    ), prompt
 
 
 def save_content_to_page_with_notes(site_page, content_json_data, session):
@@ -470,23 +632,26 @@ def generate_site_content_background(app, site_id, api_key, model='gpt-4o-mini',
                     brands=brands, brand=brand, brand_geo=brand_geo,
                     evergreen_topic=evergreen_topic,
                 )
-                page_prompts.append((page.id, page.title, prompt))
+                page_prompts.append((page.id, page.title, pt_slug, prompt))
 
             # Phase 2: Make API calls concurrently (no DB access in workers)
             results = {}
             failed = False
             error_msg = ''
 
-            def _call_api(page_id, title, prompt):
+            def _call_api(page_id, title, pt_slug, prompt):
                 logger.info('Generating page: %s (id=%d)', title, page_id)
-                content = call_openai(prompt, api_key, model)
+                content = call_openai(
+                    prompt, api_key, model_for_page_type(pt_slug, model),
+                    schema=PAGE_TYPE_SCHEMAS.get(pt_slug), schema_name=pt_slug,
+                )
                 logger.info('Completed page: %s (id=%d)', title, page_id)
                 return page_id, content
 
             with ThreadPoolExecutor(max_workers=GENERATION_WORKERS) as executor:
                 futures = {
-                    executor.submit(_call_api, pid, title, prompt): pid
-                    for pid, title, prompt in page_prompts
+                    executor.submit(_call_api, pid, title, pt_slug, prompt): pid
+                    for pid, title, pt_slug, prompt in page_prompts
                 }
                 for future in as_completed(futures):
                     pid = futures[future]
@@ -525,15 +690,15 @@ def generate_site_content_background(app, site_id, api_key, model='gpt-4o-mini',
                 db.session.commit()
                 return
 
+            # `site` is still attached to the session here — no refetch needed
+            # unless a rollback has happened.
             if failed:
-                site = db.session.get(Site, site_id)
                 site.status = 'failed'
                 db.session.commit()
                 logger.error('Content generation failed for site %d: %s', site_id, error_msg)
                 return
 
             logger.info('Content generation complete for site %d', site_id)
-            site = db.session.get(Site, site_id)
             if only_new and previous_status in ('built', 'deployed'):
                 site.status = previous_status
             else:
@@ -10,6 +10,7 @@ Deploys built static sites to a VPS using symlink-based versioning:
 """
 
 import logging
+import mmap
 import os
 import posixpath
 from datetime import datetime, timezone
@@ -39,6 +40,20 @@ def _get_connection(app_config):
     return Connection(host=host, user=user, connect_kwargs=connect_kwargs)
 
 
+def _upload_file(sftp, local_path, remote_path):
+    """Upload a single file over an open SFTP session.
+
+    The local file is memory-mapped and handed to paramiko as one buffer,
+    with pipelining enabled so writes don't wait for a per-chunk ACK.
+    """
+    with open(local_path, 'rb') as f, sftp.open(remote_path, 'wb') as rf:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap can't map empty files; the remote file is created empty
+        rf.set_pipelined(True)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rf.write(mm)
+
+
 def _generate_nginx_config(domain, web_root, ssl=False, comments_proxy_port=None):
     """Generate an Nginx server block config for a domain.
 
@@ -149,19 +164,23 @@ def deploy_site(site, app_config):
     # Create directory structure
     conn.run(f'mkdir -p {version_dir}')
 
-    # Upload site files
+    # Upload site files over a single SFTP session
     local_output = site.output_path
-    for root, dirs, files in os.walk(local_output):
-        for fname in files:
-            local_path = os.path.join(root, fname)
-            # Compute the relative path from the output directory
-            rel_path = os.path.relpath(local_path, local_output)
-            # Convert Windows backslashes to POSIX forward slashes
-            rel_path_posix = rel_path.replace('\\', '/')
-            remote_path = posixpath.join(version_dir, rel_path_posix)
-            remote_dir = posixpath.dirname(remote_path)
-            conn.run(f'mkdir -p {remote_dir}')
-            conn.put(local_path, remote=remote_path)
+    sftp = conn.sftp()
+    try:
+        for root, dirs, files in os.walk(local_output):
+            for fname in files:
+                local_path = os.path.join(root, fname)
+                # Compute the relative path from the output directory
+                rel_path = os.path.relpath(local_path, local_output)
+                # Convert Windows backslashes to POSIX forward slashes
+                rel_path_posix = rel_path.replace('\\', '/')
+                remote_path = posixpath.join(version_dir, rel_path_posix)
+                remote_dir = posixpath.dirname(remote_path)
+                conn.run(f'mkdir -p {remote_dir}')
+                _upload_file(sftp, local_path, remote_path)
+    finally:
+        sftp.close()
 
     # Verify release directory has files before updating symlink
     check = conn.run(f'find {version_dir} -type f | head -1', hide=True)
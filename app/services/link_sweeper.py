@@ -4,12 +4,15 @@ Scans content_json for internal links that point to pages that no longer
 exist on the site, and optionally removes them (keeping link text).
 """
 
+import functools
 import json
 import logging
 import re
-from urllib.parse import urlparse
+
+from sqlalchemy.orm import joinedload
 
 from ..models import db, Site, SitePage
+from ._json import loads, dumps
 from .site_builder import _page_url_for_link
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,14 @@ _LINK_RE = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+_finditer = _LINK_RE.finditer
+
+
+def _may_contain_link(text):
+    """Cheap substring gate so strings without an <a> tag skip the regex."""
+    return '<a' in text or '<A' in text
+
+
 # Static paths that are always valid (landing pages / section roots)
 _STATIC_VALID = {'/', '/reviews', '/bonuses', '/tips', '/news', '/guides'}
 
@@ -33,66 +44,96 @@ def _build_valid_urls(site_pages):
     return urls
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalise_url(href):
-    """Strip trailing slash, query params, and anchors for comparison."""
-    parsed = urlparse(href)
-    return parsed.path.rstrip('/')
+    """Strip trailing slash, query params, and anchors for comparison.
+
+    Hrefs matched by _LINK_RE are absolute paths, so a plain string split
+    is enough; the same href recurs across scan and fix, hence the cache.
+    """
+    end = len(href)
+    for ch in ('#', '?'):
+        i = href.find(ch)
+        if 0 <= i < end:
+            end = i
+    return href[:end].rstrip('/')
 
 
 def _walk_json_strings(obj, path=''):
-    """Yield (field_path, value) for every string in a nested dict/list."""
-    if isinstance(obj, str):
-        yield path, obj
-    elif isinstance(obj, dict):
-        for k, v in obj.items():
-            yield from _walk_json_strings(v, f'{path}.{k}' if path else k)
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            yield from _walk_json_strings(v, f'{path}[{i}]')
+    """Yield (field_path, value) for every string in a nested dict/list.
+
+    Iterative depth-first walk (explicit stack) in document order.
+    """
+    stack = [(path, obj)]
+    while stack:
+        path, obj = stack.pop()
+        if isinstance(obj, str):
+            yield path, obj
+        elif isinstance(obj, dict):
+            # Push in reverse so children pop in their original order
+            stack.extend(reversed([(f'{path}.{k}' if path else k, v) for k, v in obj.items()]))
+        elif isinstance(obj, list):
+            stack.extend(reversed([(f'{path}[{i}]', v) for i, v in enumerate(obj)]))
 
 
 def _extract_internal_links(text):
-    """Return list of (full_match, href, link_text) for internal links."""
-    return [(m.group(0), m.group(1), m.group(2)) for m in _LINK_RE.finditer(text)]
+    """Yield (full_match, href, link_text) for internal links."""
+    if not _may_contain_link(text):
+        return
+    for m in _finditer(text):
+        yield m.group(0), m.group(1), m.group(2)
 
 
-def _remove_dead_links(text, dead_hrefs):
-    """Replace <a> tags whose href is in dead_hrefs with their link text."""
-    def _replacer(m):
-        href = _normalise_url(m.group(1))
-        if href in dead_hrefs:
-            return m.group(2)  # keep link text, strip tag
-        return m.group(0)
-    return _LINK_RE.sub(_replacer, text)
+def _dead_link_re(dead_hrefs):
+    """Compile one regex matching only <a> tags whose href is in dead_hrefs.
+
+    dead_hrefs are normalised, so the pattern also accepts trailing
+    slashes and a query string / anchor, mirroring _normalise_url.
+    """
+    alt = '|'.join(re.escape(h) for h in sorted(dead_hrefs, key=len, reverse=True))
+    return re.compile(
+        rf'<a\s[^>]*href="(?-i:{alt})/*(?:[?#][^"]*)?"[^>]*>(.*?)</a>',
+        re.IGNORECASE | re.DOTALL,
+    )
 
 
-def _fix_json_strings(obj, dead_hrefs):
-    """Recursively walk obj and remove dead links from all string values.
+def _remove_dead_links(text, dead_re):
+    """Replace dead <a> tags with their link text.
 
-    Returns (new_obj, changes_count).
+    Returns (text, removed_count).
     """
-    if isinstance(obj, str):
-        links = _extract_internal_links(obj)
-        dead_in_str = [h for _, h, _ in links if _normalise_url(h) in dead_hrefs]
-        if dead_in_str:
-            return _remove_dead_links(obj, dead_hrefs), len(dead_in_str)
-        return obj, 0
-    elif isinstance(obj, dict):
-        total = 0
-        new = {}
-        for k, v in obj.items():
-            new[k], n = _fix_json_strings(v, dead_hrefs)
-            total += n
-        return new, total
-    elif isinstance(obj, list):
-        total = 0
-        new = []
-        for v in obj:
-            fixed, n = _fix_json_strings(v, dead_hrefs)
-            new.append(fixed)
-            total += n
-        return new, total
-    return obj, 0
+    if not _may_contain_link(text):
+        return text, 0
+    return dead_re.subn(r'\1', text)
+
+
+def _fix_content_json(raw, dead_re):
+    """Decode raw content_json, removing dead links while objects are built.
+
+    The scrubbing runs inside json.loads' object_hook, so no separate tree
+    walk is needed: each dict is cleaned as the decoder produces it (nested
+    dicts first), and list values are cleaned element-wise.
+
+    Returns (content, changes_count).
+    """
+    count = 0
+
+    def _scrub(v):
+        nonlocal count
+        if isinstance(v, str):
+            v, n = _remove_dead_links(v, dead_re)
+            count += n
+            return v
+        if isinstance(v, list):
+            # Dicts inside the list were already scrubbed by the hook
+            return [_scrub(x) for x in v]
+        return v
+
+    def _hook(d):
+        return {k: _scrub(v) for k, v in d.items()}
+
+    content = _scrub(json.loads(raw, object_hook=_hook))
+    return content, count
 
 
 def sweep_dead_links(site_id, fix=False):
@@ -109,19 +150,28 @@ def sweep_dead_links(site_id, fix=False):
     if not site:
         return {'dead_links': [], 'count': 0, 'fixed': 0, 'pages_updated': 0}
 
-    pages = SitePage.query.filter_by(site_id=site_id).all()
+    # Every page's URL depends on its page type
+    pages = (SitePage.query.options(joinedload(SitePage.page_type))
+             .filter_by(site_id=site_id).all())
     valid_urls = _build_valid_urls(pages)
 
-    dead_links = []
-
+    # Parse each page's content once; reused by both the scan and fix passes
+    parsed = {}
     for page in pages:
         if not page.content_json:
             continue
         try:
-            content = json.loads(page.content_json)
+            parsed[page.id] = loads(page.content_json)
         except (json.JSONDecodeError, TypeError):
             continue
 
+    dead_links = []
+
+    for page in pages:
+        content = parsed.get(page.id)
+        if content is None:
+            continue
+
         for field_path, text in _walk_json_strings(content):
             for full_match, href, link_text in _extract_internal_links(text):
                 normalised = _normalise_url(href)
@@ -139,18 +189,15 @@ def sweep_dead_links(site_id, fix=False):
     pages_updated = 0
 
     if fix and dead_links:
-        dead_hrefs = {_normalise_url(d['link_url']) for d in dead_links}
+        dead_re = _dead_link_re({_normalise_url(d['link_url']) for d in dead_links})
+        dirty_page_ids = {d['page_id'] for d in dead_links}
         for page in pages:
-            if not page.content_json:
-                continue
-            try:
-                content = json.loads(page.content_json)
-            except (json.JSONDecodeError, TypeError):
+            if page.id not in dirty_page_ids:
                 continue
 
-            new_content, n = _fix_json_strings(content, dead_hrefs)
+            new_content, n = _fix_content_json(page.content_json, dead_re)
             if n > 0:
-                page.content_json = json.dumps(new_content)
+                page.content_json = dumps(new_content)
                 fixed += n
                 pages_updated += 1
 
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from flask import current_app
 
@@ -12,6 +13,11 @@ logger = logging.getLogger(__name__)
 
 AVATAR_STYLES = ['bottts', 'avataaars', 'identicon', 'thumbs']
 
+# Personas are requested in parallel batches, each steered by a different
+# style hint so the batches don't converge on the same usernames.
+PERSONA_BATCH_SIZE = 5
+PERSONA_STYLE_HINTS = ['casual bettors', 'sharp punters', 'newbies']
+
 
 def generate_personas(site_id, count=10, app=None):
     """Generate bot personas for a site.
@@ -37,9 +43,10 @@ def generate_personas(site_id, count=10, app=None):
     # Check existing usernames to avoid duplicates
     existing = {u.username for u in CommentUser.query.filter_by(site_id=site_id).all()}
 
-    prompt = f"""Generate {count} unique commenter personas for a {geo.name} sports betting community forum.
+    def _prompt(batch_count, style_hint):
+        return f"""Generate {batch_count} unique commenter personas for a {geo.name} sports betting community forum.
 
-Each persona should feel like a real person from {geo.name} who follows sports betting. Mix of casual bettors, sharp punters, and newbies.
+Each persona should feel like a real person from {geo.name} who follows sports betting. Focus mostly on {style_hint}.
 
 For each persona provide:
 - username: a realistic forum username (lowercase, no spaces, 6-15 chars). Avoid generic names like "user123".
@@ -52,16 +59,26 @@ For each persona provide:
 
 Return a JSON object with key "personas" containing an array of persona objects."""
 
-    result = call_openai(prompt, api_key, model, max_tokens=4096)
-    personas = result.get('personas', [])
+    prompts = [
+        _prompt(min(PERSONA_BATCH_SIZE, count - start),
+                PERSONA_STYLE_HINTS[i % len(PERSONA_STYLE_HINTS)])
+        for i, start in enumerate(range(0, count, PERSONA_BATCH_SIZE))
+    ]
+
+    def _call_api(prompt):
+        return call_openai(prompt, api_key, model, max_tokens=4096)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(prompts))) as executor:
+        results = list(executor.map(_call_api, prompts))
+    personas = [p for r in results for p in r.get('personas', [])]
 
-    created = 0
+    new_users = []
     for p in personas:
         username = p.get('username', '').strip().lower()
         if not username or username in existing:
             continue
 
-        user = CommentUser(
+        new_users.append(CommentUser(
             site_id=site_id,
             username=username,
             display_name=p.get('display_name', username),
@@ -69,11 +86,13 @@ Return a JSON object with key "personas" containing an array of persona objects.
             avatar_seed=username,
             persona_json=json.dumps(p),
             is_bot=True,
-        )
-        db.session.add(user)
+        ))
         existing.add(username)
-        created += 1
 
+    # Nothing reads the new rows back through the session, so skip
+    # per-object unit-of-work tracking and insert them in one batch
+    db.session.bulk_save_objects(new_users)
     db.session.commit()
+    created = len(new_users)
     logger.info('Created %d personas for site %d', created, site_id)
     return created
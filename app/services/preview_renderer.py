@@ -4,9 +4,12 @@ Renders a page using the same Jinja2 templates as site_builder.py
 but without writing to disk. Used for the live preview iframe.
 """
 
-import json
+import functools
+import zlib
 from datetime import datetime
+from operator import attrgetter, itemgetter
 
+from ._json import loads
 from .site_builder import (
     _get_jinja_env, _build_nav_links, _build_footer_links,
     _build_brand_info_list, _build_brand_lookup, _build_cta_table_data,
@@ -15,6 +18,63 @@ from .site_builder import (
 from .schema_generator import generate_schema
 
 
+@functools.lru_cache(maxsize=64)
+def _get_template(template_file):
+    """Load and compile a site template once per process.
+
+    Call _get_template.cache_clear() to pick up edited templates.
+    """
+    return _get_jinja_env().get_template(template_file)
+
+
+@functools.lru_cache(maxsize=1024)
+def _author_display(author_id, name, slug, role, short_bio, bio,
+                    avatar_filename, expertise_json, social_links_json):
+    """Parsed byline data for an author, cached on the row's field values.
+
+    Treat the returned dict as read-only; it is shared between renders.
+    The avatar colour uses crc32 so it is stable across processes.
+    """
+    return {
+        'name': name, 'slug': slug, 'role': role,
+        'short_bio': short_bio, 'bio': bio,
+        'avatar_filename': avatar_filename,
+        'expertise': loads(expertise_json) if expertise_json else [],
+        'social_links': loads(social_links_json) if social_links_json else {},
+        'initials': ''.join(w[0] for w in name.split()[:2]).upper(),
+        'color': f'hsl({zlib.crc32(name.encode()) % 360}, 45%, 45%)',
+    }
+
+
+def _preview_site_ctx(site, pages):
+    """Build the site-level data shared by every page preview of a site.
+
+    Returns (nav_links, footer_links, brand_info_list, brand_lookup,
+    cluster_map, pages_by_id, pages_by_type, review_slugs, bonus_slugs).
+    The page-derived pieces come from a single pass over pages.
+    """
+    nav_links = _build_nav_links(pages)
+    footer_links = _build_footer_links(pages)
+    brand_info_list = _build_brand_info_list(site, site.geo)
+    brand_lookup = _build_brand_lookup(brand_info_list)
+
+    cluster_map = {}
+    pages_by_id = {}
+    pages_by_type = {}
+    for p in pages:
+        pages_by_id[p.id] = p
+        if p.nav_parent_id is not None:
+            cluster_map.setdefault(p.nav_parent_id, []).append(p)
+        pages_by_type.setdefault(p.page_type.slug, []).append(p)
+
+    # Brand slugs that have actual pages (for conditional linking)
+    review_slugs = {p.slug for p in pages_by_type.get('brand-review', ())}
+    bonus_slugs = {p.slug for p in pages_by_type.get('bonus-review', ())}
+
+    return (nav_links, footer_links, brand_info_list, brand_lookup,
+            cluster_map, pages_by_id, pages_by_type, review_slugs, bonus_slugs)
+
+
 def render_page_preview(site_page, site, asset_url_prefix=''):
     """Render a page to HTML string for preview.
 
@@ -26,18 +86,26 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
     Returns:
         str: Rendered HTML string
     """
-    env = _get_jinja_env()
     geo = site.geo
     vertical = site.vertical
     pages = site.site_pages
     domain = site.domain.domain if site.domain else 'example.com'
 
-    nav_links = _build_nav_links(pages)
-    footer_links = _build_footer_links(pages)
-    brand_info_list = _build_brand_info_list(site, geo)
-    brand_lookup = _build_brand_lookup(brand_info_list)
+    (nav_links, footer_links, brand_info_list, brand_lookup,
+     cluster_map, pages_by_id, pages_by_type, review_slugs,
+     bonus_slugs) = _preview_site_ctx(site, pages)
+
+    # Parsed content_json per page id, so each blob is decoded at most once
+    parsed_content = {}
+
+    def _pc(p):
+        v = parsed_content.get(p.id)
+        if v is None and p.content_json:
+            v = loads(p.content_json)
+            parsed_content[p.id] = v
+        return v
 
-    content = json.loads(site_page.content_json) if site_page.content_json else {}
+    content = _pc(site_page) or {}
     pt_slug = site_page.page_type.slug
     template_file = site_page.page_type.template_file
 
@@ -50,46 +118,45 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
         cta_table_data = _build_cta_table_data(site_page.cta_table, brand_info_list, geo)
 
     # Build cluster sidebar links
-    cluster_map = {}
-    for p in pages:
-        if p.nav_parent_id is not None:
-            cluster_map.setdefault(p.nav_parent_id, []).append(p)
-
     cluster_links = []
     parent_id = site_page.nav_parent_id or (site_page.id if site_page.id in cluster_map else None)
     if parent_id is not None:
         siblings = cluster_map.get(parent_id, [])
-        parent_page = next((p for p in pages if p.id == parent_id), None)
+        parent_page = pages_by_id.get(parent_id)
         if parent_page and parent_page.id != site_page.id:
             cluster_links.append({
                 'url': _page_url_for_link(parent_page),
                 'label': _page_display_title(parent_page),
             })
-        for sib in sorted(siblings, key=lambda s: (s.nav_order, s.id)):
+        for sib in sorted(siblings, key=attrgetter('nav_order', 'id')):
             if sib.id != site_page.id:
                 cluster_links.append({
                     'url': _page_url_for_link(sib),
                     'label': _page_display_title(sib),
                 })
 
-    # Build sets of brand slugs that have actual pages (for conditional linking)
-    review_slugs = {p.slug for p in pages if p.page_type.slug == 'brand-review'}
-    bonus_slugs = {p.slug for p in pages if p.page_type.slug == 'bonus-review'}
-
-    # Build author data for byline
-    from ..models import Author
-    authors = Author.query.filter_by(site_id=site.id, is_active=True).all()
-    author_map = {}
-    for a in authors:
-        author_map[a.id] = {
-            'name': a.name, 'slug': a.slug, 'role': a.role,
-            'short_bio': a.short_bio, 'bio': a.bio,
-            'avatar_filename': a.avatar_filename,
-            'expertise': json.loads(a.expertise) if a.expertise else [],
-            'social_links': json.loads(a.social_links) if a.social_links else {},
-            'initials': ''.join(w[0] for w in a.name.split()[:2]).upper(),
-            'color': f'hsl({hash(a.name) % 360}, 45%, 45%)',
-        }
+    # Build author data for byline. Only the homepage lists every author;
+    # other page types need at most the page's own author.
+    from ..models import Author, db
+    if pt_slug == 'homepage':
+        authors = Author.query.filter_by(site_id=site.id, is_active=True).all()
+        has_authors = bool(authors)
+    else:
+        if site_page.author_id is not None:
+            a = db.session.get(Author, site_page.author_id)
+            authors = [a] if a and a.is_active and a.site_id == site.id else []
+        else:
+            authors = []
+        # The footer's "Our Team" link shows whenever the site has any
+        # active author, not just when this page has one
+        has_authors = bool(authors) or db.session.query(
+            Author.query.filter_by(site_id=site.id, is_active=True).exists()
+        ).scalar()
+    author_map = {
+        a.id: _author_display(a.id, a.name, a.slug, a.role, a.short_bio, a.bio,
+                              a.avatar_filename, a.expertise, a.social_links)
+        for a in authors
+    }
     page_author = author_map.get(site_page.author_id) if site_page.author_id else None
 
     ctx = {
@@ -114,7 +181,7 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
         'review_slugs': review_slugs,
         'bonus_slugs': bonus_slugs,
         'page_author': page_author,
-        'has_authors': len(authors) > 0,
+        'has_authors': has_authors,
         'comments_enabled': getattr(site, 'comments_enabled', False),
         'comments_api_url': getattr(site, 'comments_api_url', '') or '',
         'site_id': site.id,
@@ -124,52 +191,45 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
 
     # Add page-type-specific context (same as site_builder.py)
     if pt_slug == 'homepage':
-        top_brands_ai = content.get('top_brands', [])
+        # AI-generated top_brands data, looked up per brand in the template
         ai_map = {}
-        for tb in top_brands_ai:
+        for tb in content.get('top_brands', []):
             if tb.get('slug'):
                 ai_map[tb['slug']] = tb
             if tb.get('name'):
                 ai_map[tb['name']] = tb
-        enriched = []
-        for b in brand_info_list:
-            merged = dict(b)
-            ai = ai_map.get(b['slug']) or ai_map.get(b['name'], {})
-            merged['selling_points'] = ai.get('selling_points', [])
-            merged['short_description'] = ai.get('short_description', '')
-            merged['feature_badges'] = ai.get('feature_badges', [])
-            enriched.append(merged)
-        ctx['site_brands'] = enriched
-        # Update brand_lookup so CTA table rows also get enriched data
-        enriched_lookup = _build_brand_lookup(enriched)
-        ctx['brand_lookup'] = enriched_lookup
+        ctx['brand_ai_map'] = ai_map
 
         # --- Homepage hub data ---
 
-        # Tips preview: 4 most recent tips-articles
+        # Tips preview: 4 most recent tips-articles, newest match (or
+        # publish) date first. Entries are sorted as (key, tip) pairs so
+        # the key never ends up in the template data.
         tips_preview = []
-        for p in pages:
-            if p.page_type.slug == 'tips-article' and p.content_json:
-                p_content = json.loads(p.content_json)
+        for p in pages_by_type.get('tips-article', ()):
+            if p.content_json:
+                p_content = _pc(p)
                 match_info = p_content.get('match_info', {})
                 prediction = p_content.get('prediction', {})
-                tips_preview.append({
+                pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
+                match_date = match_info.get('date', '')
+                tips_preview.append((match_date or pub_date, {
                     'slug': p.slug, 'title': p.title,
-                    'published_date': p.published_date.strftime('%d %b %Y') if p.published_date else '',
+                    'published_date': pub_date,
                     'summary': p_content.get('hero_subtitle', ''),
                     'competition': match_info.get('competition', ''),
-                    'match_date': match_info.get('date', ''),
+                    'match_date': match_date,
                     'prediction_result': prediction.get('result', ''),
                     'prediction_confidence': prediction.get('confidence', ''),
-                })
-        tips_preview.sort(key=lambda a: a['match_date'] or a['published_date'], reverse=True)
-        ctx['tips_preview'] = tips_preview[:4]
+                }))
+        tips_preview.sort(key=itemgetter(0), reverse=True)
+        ctx['tips_preview'] = [tip for _, tip in tips_preview[:4]]
 
         # News preview: 3 most recent news-articles
         news_preview = []
-        for p in pages:
-            if p.page_type.slug == 'news-article' and p.content_json:
-                p_content = json.loads(p.content_json)
+        for p in pages_by_type.get('news-article', ()):
+            if p.content_json:
+                p_content = _pc(p)
                 pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
                 p_author = author_map.get(p.author_id) if p.author_id else None
                 news_preview.append({
@@ -177,7 +237,7 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
                     'summary': (p_content.get('hero_subtitle', '') or '')[:120],
                     'author_name': p_author['name'] if p_author else None,
                 })
-        news_preview.sort(key=lambda a: a['published_date'], reverse=True)
+        news_preview.sort(key=itemgetter('published_date'), reverse=True)
         ctx['news_preview'] = news_preview[:3]
 
         # Authors list with article counts
@@ -185,9 +245,10 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
         if authors:
             hp_content_types = {'brand-review', 'bonus-review', 'evergreen', 'news-article', 'tips-article'}
             author_counts = {}
-            for p in pages:
-                if p.author_id and p.page_type.slug in hp_content_types:
-                    author_counts[p.author_id] = author_counts.get(p.author_id, 0) + 1
+            for pt in hp_content_types:
+                for p in pages_by_type.get(pt, ()):
+                    if p.author_id:
+                        author_counts[p.author_id] = author_counts.get(p.author_id, 0) + 1
             for a_id, a_info in author_map.items():
                 entry = dict(a_info)
                 entry['article_count'] = author_counts.get(a_id, 0)
@@ -195,13 +256,10 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
         ctx['authors_list'] = hp_authors_list
 
         # Page counts for trust badges
-        type_counts = {}
-        for p in pages:
-            type_counts[p.page_type.slug] = type_counts.get(p.page_type.slug, 0) + 1
         ctx['page_counts'] = {
-            'tips': type_counts.get('tips-article', 0),
-            'reviews': type_counts.get('brand-review', 0),
-            'news': type_counts.get('news-article', 0),
+            'tips': len(pages_by_type.get('tips-article', ())),
+            'reviews': len(pages_by_type.get('brand-review', ())),
+            'news': len(pages_by_type.get('news-article', ())),
             'brands': len(brand_info_list),
         }
 
@@ -234,9 +292,9 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
         ctx['other_brands'] = [b for b in brand_info_list if b['slug'] != site_page.slug][:4]
     elif pt_slug == 'news':
         news_articles = []
-        for p in pages:
-            if p.page_type.slug == 'news-article' and p.content_json:
-                p_content = json.loads(p.content_json)
+        for p in pages_by_type.get('news-article', ()):
+            if p.content_json:
+                p_content = _pc(p)
                 pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
                 news_articles.append({
                     'slug': p.slug,
@@ -244,16 +302,16 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
                     'published_date': pub_date,
                     'summary': p_content.get('hero_subtitle', ''),
                 })
-        news_articles.sort(key=lambda a: a['published_date'], reverse=True)
+        news_articles.sort(key=itemgetter('published_date'), reverse=True)
         ctx['news_articles'] = news_articles
     elif pt_slug == 'news-article':
         ctx['published_date'] = site_page.published_date.strftime('%d %b %Y') if site_page.published_date else ''
 
     elif pt_slug == 'tips':
         tips_articles = []
-        for p in pages:
-            if p.page_type.slug == 'tips-article' and p.content_json:
-                p_content = json.loads(p.content_json)
+        for p in pages_by_type.get('tips-article', ()):
+            if p.content_json:
+                p_content = _pc(p)
                 pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
                 prediction = p_content.get('prediction', {})
                 match_info = p_content.get('match_info', {})
@@ -267,7 +325,7 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
                     'prediction_result': prediction.get('result', ''),
                     'prediction_confidence': prediction.get('confidence', ''),
                 })
-        tips_articles.sort(key=lambda a: a['published_date'], reverse=True)
+        tips_articles.sort(key=itemgetter('published_date'), reverse=True)
         ctx['tips_articles'] = tips_articles
 
     elif pt_slug == 'tips-article':
@@ -281,5 +339,4 @@ def render_page_preview(site_page, site, asset_url_prefix=''):
     if asset_url_prefix:
         ctx['preview_asset_prefix'] = asset_url_prefix
 
-    template = env.get_template(template_file)
-    return template.render(**ctx)
+    return _get_template(template_file).render(**ctx)
@@ -4,8 +4,16 @@ Auto-generates JSON-LD blocks for each page type at build time.
 Stateless — give it a page type and data, get back a JSON-LD string.
 """
 
+import functools
 import json
-from datetime import datetime
+from datetime import date
+from json.encoder import encode_basestring as _esc
+
+from ._json import encode_str as _esc_long
+
+# One preconfigured encoder for every schema: json.dumps builds a new
+# JSONEncoder on each call whenever a non-default option is passed.
+_encode = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def generate_schema(page_type_slug, content, page_title, site_name, domain,
@@ -28,218 +36,237 @@ def generate_schema(page_type_slug, content, page_title, site_name, domain,
     Returns:
         str: JSON-LD script tag(s) ready for injection into <head>, or empty string.
     """
-    schemas = []
-    base_url = f'https://{domain}'
-    full_url = f'{base_url}{page_url}'
-    date_str = generated_at.strftime('%Y-%m-%d') if generated_at else datetime.now().strftime('%Y-%m-%d')
-
-    # Build author schema block (Person if author exists, else Organization)
-    author_schema = _build_author_block(author_info, domain) if author_info else {
-        '@type': 'Organization', 'name': site_name,
-    }
-
-    if page_type_slug == 'homepage':
-        schemas.append(_website_schema(site_name, base_url))
-
-    elif page_type_slug == 'brand-review':
-        schemas.append(_review_schema(
-            content, page_title, full_url, site_name,
-            brand_info, rating, date_str, author_schema,
-        ))
-
-    elif page_type_slug == 'bonus-review':
-        schemas.append(_review_schema(
-            content, page_title, full_url, site_name,
-            brand_info, rating, date_str, author_schema,
-        ))
-
-    elif page_type_slug == 'comparison':
-        schemas.append(_itemlist_schema(content, full_url, site_name))
-
-    elif page_type_slug == 'evergreen':
-        schemas.append(_article_schema(
-            content, page_title, full_url, site_name, date_str, author_schema,
-        ))
-
-    elif page_type_slug == 'news-article':
-        schemas.append(_article_schema(
-            content, page_title, full_url, site_name, date_str, author_schema,
-        ))
-
-    elif page_type_slug == 'tips-article':
-        schemas.append(_article_schema(
-            content, page_title, full_url, site_name, date_str, author_schema,
-        ))
-
-    elif page_type_slug == 'author':
-        schemas.append(_profile_page_schema(
-            content, full_url,
-        ))
+    parts = []
+    app = parts.append
+    base_url = _base_url_for(domain)
+    full_url = base_url + page_url
+    date_str = _format_date((generated_at or date.today()).toordinal())
+
+    emit = _EMITTERS.get(page_type_slug)
+    if emit is not None:
+        emit(app, content, page_title, site_name, base_url, full_url,
+             brand_info, rating, date_str, author_info)
 
     # Append FAQPage schema if the content has FAQ data
-    faq_schema = _faq_schema(content)
-    if faq_schema:
-        schemas.append(faq_schema)
+    _emit_faq(app, content, '\n' if parts else '')
 
-    if not schemas:
-        return ''
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=16)
+def _base_url_for(domain):
+    """https:// URL for a site domain; a build uses the same one throughout."""
+    return 'https://' + domain
 
-    # Render all schemas as script tags
-    parts = []
-    for schema in schemas:
-        parts.append(
-            f'<script type="application/ld+json">{json.dumps(schema, ensure_ascii=False)}</script>'
-        )
-    return '\n'.join(parts)
 
+@functools.lru_cache(maxsize=128)
+def _format_date(ordinal):
+    """YYYY-MM-DD for a proleptic Gregorian ordinal.
 
-def _website_schema(site_name, base_url):
+    Keyed on the day rather than the datetime: generation timestamps are
+    all distinct, but a build only spans a handful of days.
+    """
+    return date.fromordinal(ordinal).isoformat()
+
+
+# The _emit_* helpers append one complete <script> tag each, writing the
+# JSON directly (same separators as json.dumps) instead of building a dict
+# to serialise. Strings built here (URLs, dates, ratings) go straight to
+# the C escaper _esc; caller-supplied values of unknown type go through
+# _encode. The page-type
+# emitters share one signature so generate_schema can dispatch through
+# _EMITTERS.
+
+# Fixed JSON fragments, built once at import
+_LD_OPEN = '<script type="application/ld+json">{"@context": "https://schema.org", "@type": '
+_LD_CLOSE = '}</script>'
+_LIST_LD_CLOSE = ']' + _LD_CLOSE
+_NESTED_LD_CLOSE = '}' + _LD_CLOSE
+_WEBSITE_PREFIX = _LD_OPEN + '"WebSite", "name": '
+_REVIEW_PREFIX = _LD_OPEN + '"Review", "name": '
+_ITEMLIST_PREFIX = _LD_OPEN + '"ItemList", "name": '
+_ARTICLE_PREFIX = _LD_OPEN + '"Article", "headline": '
+_FAQ_PREFIX = _LD_OPEN + '"FAQPage", "mainEntity": ['
+_PROFILE_PREFIX = _LD_OPEN + '"ProfilePage", "mainEntity": {"@type": "Person", "name": '
+_ORGANIZATION_TMPL = '{"@type": "Organization", "name": %s}'
+_RATING_TMPL = ', "reviewRating": {"@type": "Rating", "ratingValue": %s, "bestRating": "5", "worstRating": "1"}'
+
+
+def _emit_website(app, content, page_title, site_name, base_url, full_url,
+                  brand_info, rating, date_str, author_info):
     """WebSite schema for homepage."""
-    return {
-        '@context': 'https://schema.org',
-        '@type': 'WebSite',
-        'name': site_name,
-        'url': base_url,
-    }
+    app(_WEBSITE_PREFIX)
+    app(_encode(site_name))
+    app(', "url": ')
+    app(_esc(base_url))
+    app(_LD_CLOSE)
 
 
-def _review_schema(content, page_title, full_url, site_name,
-                   brand_info, rating, date_str, author_schema=None):
+def _emit_review(app, content, page_title, site_name, base_url, full_url,
+                 brand_info, rating, date_str, author_info):
     """Review schema for brand/bonus review pages."""
-    schema = {
-        '@context': 'https://schema.org',
-        '@type': 'Review',
-        'name': page_title,
-        'url': full_url,
-        'author': author_schema or {'@type': 'Organization', 'name': site_name},
-        'datePublished': date_str,
-    }
+    app(_REVIEW_PREFIX)
+    app(_encode(page_title))
+    app(', "url": ')
+    app(_esc(full_url))
+    app(', "author": ')
+    app(_author_json(author_info, base_url, site_name))
+    app(', "datePublished": ')
+    app(_esc(date_str))
 
     if brand_info:
-        schema['itemReviewed'] = {
-            '@type': 'Organization',
-            'name': brand_info.get('name', ''),
-        }
-        if brand_info.get('website_url'):
-            schema['itemReviewed']['url'] = brand_info['website_url']
+        app(', "itemReviewed": {"@type": "Organization", "name": ')
+        app(_encode(brand_info.get('name', '')))
+        website_url = brand_info.get('website_url')
+        if website_url:
+            app(', "url": ')
+            app(_encode(website_url))
+        app('}')
 
     if rating is not None:
-        schema['reviewRating'] = {
-            '@type': 'Rating',
-            'ratingValue': str(rating),
-            'bestRating': '5',
-            'worstRating': '1',
-        }
+        app(_RATING_TMPL % _esc(str(rating)))
 
-    return schema
+    app(_LD_CLOSE)
 
 
-def _itemlist_schema(content, full_url, site_name):
+def _emit_itemlist(app, content, page_title, site_name, base_url, full_url,
+                   brand_info, rating, date_str, author_info):
     """ItemList schema for comparison pages."""
-    schema = {
-        '@context': 'https://schema.org',
-        '@type': 'ItemList',
-        'name': content.get('hero_title', 'Comparison'),
-        'url': full_url,
-    }
+    app(_ITEMLIST_PREFIX)
+    app(_encode(content.get('hero_title', 'Comparison')))
+    app(', "url": ')
+    app(_esc(full_url))
 
     rows = content.get('comparison_rows', [])
     if rows:
-        items = []
+        esc, encode = _esc, _encode  # locals for the loop
+        app(', "itemListElement": [')
         for i, row in enumerate(rows, 1):
-            item = {
-                '@type': 'ListItem',
-                'position': i,
-                'name': row.get('brand', row.get('name', '')),
-            }
-            if row.get('rating'):
-                item['description'] = f"Rating: {row['rating']}/5"
-            items.append(item)
-        schema['itemListElement'] = items
-
-    return schema
-
-
-def _article_schema(content, page_title, full_url, site_name, date_str,
-                    author_schema=None):
+            if i > 1:
+                app(', ')
+            app(f'{{"@type": "ListItem", "position": {i}, "name": ')
+            app(encode(row['brand'] if 'brand' in row else row.get('name', '')))
+            row_rating = row.get('rating')
+            if row_rating:
+                app(', "description": ')
+                app(esc(f'Rating: {row_rating}/5'))
+            app('}')
+        app(']')
+
+    app(_LD_CLOSE)
+
+
+def _emit_article(app, content, page_title, site_name, base_url, full_url,
+                  brand_info, rating, date_str, author_info):
     """Article schema for evergreen content pages."""
-    return {
-        '@context': 'https://schema.org',
-        '@type': 'Article',
-        'headline': content.get('hero_title', page_title),
-        'url': full_url,
-        'datePublished': date_str,
-        'dateModified': date_str,
-        'author': author_schema or {'@type': 'Organization', 'name': site_name},
-        'publisher': {
-            '@type': 'Organization',
-            'name': site_name,
-        },
-    }
-
-
-def _faq_schema(content):
-    """FAQPage schema — appended to any page with FAQ content."""
-    faqs = content.get('faq', [])
-    if not faqs:
-        return None
-
-    items = []
-    for faq in faqs:
+    app(_ARTICLE_PREFIX)
+    app(_encode(content.get('hero_title', page_title)))
+    app(', "url": ')
+    app(_esc(full_url))
+    app(', "datePublished": ')
+    app(_esc(date_str))
+    app(', "dateModified": ')
+    app(_esc(date_str))
+    app(', "author": ')
+    app(_author_json(author_info, base_url, site_name))
+    app(', "publisher": ')
+    app(_organization_json(site_name))
+    app(_LD_CLOSE)
+
+
+def _emit_faq(app, content, sep):
+    """FAQPage schema — appended to any page with FAQ content.
+
+    Streams one pass over content['faq']; nothing (not even sep) is written
+    unless at least one entry has both a question and an answer. Answers
+    can run to kilobytes, so string values skip the encoder's type
+    dispatch; answers use orjson's escaper when it is installed.
+    """
+    esc, esc_long, encode = _esc, _esc_long, _encode  # locals for the loop
+    emitted = False
+    for faq in content.get('faq') or ():
         q = faq.get('question', '')
         a = faq.get('answer', '')
-        if q and a:
-            items.append({
-                '@type': 'Question',
-                'name': q,
-                'acceptedAnswer': {
-                    '@type': 'Answer',
-                    'text': a,
-                },
-            })
-
-    if not items:
-        return None
-
-    return {
-        '@context': 'https://schema.org',
-        '@type': 'FAQPage',
-        'mainEntity': items,
-    }
-
-
-def _build_author_block(author_info, domain):
-    """Build a Person schema block from author_info dict."""
-    person = {
-        '@type': 'Person',
-        'name': author_info.get('name', ''),
-        'url': f'https://{domain}/authors/{author_info.get("slug", "")}',
-    }
-    if author_info.get('role'):
-        person['jobTitle'] = author_info['role']
-    return person
-
-
-def _profile_page_schema(author_info, full_url):
-    """ProfilePage schema for author profile pages."""
-    person = {
-        '@type': 'Person',
-        'name': author_info.get('name', ''),
-        'url': full_url,
-    }
-    if author_info.get('role'):
-        person['jobTitle'] = author_info['role']
-    if author_info.get('short_bio'):
-        person['description'] = author_info['short_bio']
-    if author_info.get('expertise'):
-        person['knowsAbout'] = author_info['expertise']
-    if author_info.get('social_links'):
-        same_as = [v for v in author_info['social_links'].values() if v]
+        if not (q and a):
+            continue
+        if emitted:
+            app(', ')
+        else:
+            app(sep)
+            app(_FAQ_PREFIX)
+            emitted = True
+        app('{"@type": "Question", "name": ')
+        app(esc(q) if isinstance(q, str) else encode(q))
+        app(', "acceptedAnswer": {"@type": "Answer", "text": ')
+        app(esc_long(a) if isinstance(a, str) else encode(a))
+        app('}}')
+    if emitted:
+        app(_LIST_LD_CLOSE)
+
+
+def _author_json(author_info, base_url, site_name):
+    """Author block as JSON: Person if author exists, else Organization."""
+    if not author_info:
+        return _organization_json(site_name)
+    return _person_json(author_info.get('name', ''), author_info.get('slug', ''),
+                        author_info.get('role'), base_url)
+
+
+@functools.lru_cache(maxsize=16)
+def _organization_json(site_name):
+    """Organization block for the site; identical on every page of a build."""
+    return _ORGANIZATION_TMPL % _encode(site_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _person_json(name, slug, role, base_url):
+    """Person schema block as JSON; a site's few authors repeat on every page."""
+    person = (
+        '{"@type": "Person", "name": ' + _encode(name)
+        + ', "url": ' + _esc(f'{base_url}/authors/{slug}')
+    )
+    if role:
+        person += ', "jobTitle": ' + _encode(role)
+    return person + '}'
+
+
+def _emit_profile_page(app, content, page_title, site_name, base_url, full_url,
+                       brand_info, rating, date_str, author_info):
+    """ProfilePage schema for author profile pages (content is the author's data)."""
+    author_info = content
+    app(_PROFILE_PREFIX)
+    app(_encode(author_info.get('name', '')))
+    app(', "url": ')
+    app(_esc(full_url))
+    role = author_info.get('role')
+    if role:
+        app(', "jobTitle": ')
+        app(_encode(role))
+    short_bio = author_info.get('short_bio')
+    if short_bio:
+        app(', "description": ')
+        app(_encode(short_bio))
+    expertise = author_info.get('expertise')
+    if expertise:
+        app(', "knowsAbout": ')
+        app(_encode(expertise))
+    social_links = author_info.get('social_links')
+    if social_links:
+        same_as = list(filter(None, social_links.values()))
         if same_as:
-            person['sameAs'] = same_as
-
-    return {
-        '@context': 'https://schema.org',
-        '@type': 'ProfilePage',
-        'mainEntity': person,
-    }
+            app(', "sameAs": ')
+            app(_encode(same_as))
+    app(_NESTED_LD_CLOSE)
+
+
+# Page type slug -> schema emitter
+_EMITTERS = {
+    'homepage': _emit_website,
+    'brand-review': _emit_review,
+    'bonus-review': _emit_review,
+    'comparison': _emit_itemlist,
+    'evergreen': _emit_article,
+    'news-article': _emit_article,
+    'tips-article': _emit_article,
+    'author': _emit_profile_page,
+}
@@ -4,22 +4,50 @@ Renders generated content into static HTML files using a SEPARATE
 Jinja2 Environment pointed at site_templates/ — NOT Flask's render_template.
 """
 
-import hashlib
+import functools
 import json
 import logging
 import os
 import shutil
+import zlib
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
+from types import MappingProxyType
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 import jinja2
+from jinja2.environment import TemplateStream
 
 from markupsafe import Markup
+from sqlalchemy.orm import joinedload, selectinload
 
 logger = logging.getLogger(__name__)
 
-from ..models import db, Author, Site, SitePage, SiteBrand, OddsConfig, OddsFixture, OddsData
+from ..models import (
+    db, Author, BrandGeo, CTATable, Site, SitePage, SiteBrand, OddsConfig, OddsFixture, OddsData,
+)
+from ._json import loads
 from .schema_generator import generate_schema
 
+# Threads rendering and writing pages during a build; the contexts are
+# plain dicts by then, so workers never touch the DB session
+RENDER_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# Linux ioctl that clones a file's extents (reflink); see _clone_or_copy
+_FICLONE = 0x40049409
+
+
+@functools.lru_cache(maxsize=64)
+def _vertical_hue(vertical_slug):
+    """Derive a hue from the vertical slug for colour variety."""
+    return zlib.crc32(vertical_slug.encode()) % 360
+
 
 def _generate_favicon_svg(site_name, vertical_slug):
     """Generate an SVG favicon using site name initials and a colour from the vertical."""
@@ -30,9 +58,7 @@ def _generate_favicon_svg(site_name, vertical_slug):
     else:
         initials = site_name[:2].upper()
 
-    # Derive a hue from the vertical slug for colour variety
-    hue = int(hashlib.md5(vertical_slug.encode()).hexdigest()[:4], 16) % 360
-    bg_colour = f'hsl({hue}, 55%, 45%)'
+    bg_colour = f'hsl({_vertical_hue(vertical_slug)}, 55%, 45%)'
 
     return f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32">
 <rect width="32" height="32" rx="6" fill="{bg_colour}"/>
@@ -42,7 +68,7 @@ def _generate_favicon_svg(site_name, vertical_slug):
 
 
 # Inline SVG payment method icons (monochrome, 28x18)
-PAYMENT_ICON_MAP = {
+_PAYMENT_ICONS = {
     'visa': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="28" height="18" rx="2" fill="#1a1f71" opacity="0.15"/><text x="14" y="12" text-anchor="middle" font-size="7" font-weight="700" font-family="sans-serif" fill="#1a1f71">VISA</text></svg>'),
     'mastercard': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="11" cy="9" r="6" fill="#eb001b" opacity="0.25"/><circle cx="17" cy="9" r="6" fill="#f79e1b" opacity="0.25"/></svg>'),
     'maestro': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="11" cy="9" r="6" fill="#0099df" opacity="0.25"/><circle cx="17" cy="9" r="6" fill="#000" opacity="0.15"/></svg>'),
@@ -54,10 +80,74 @@ PAYMENT_ICON_MAP = {
     'opay': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#1dcf9f" opacity="0.2"/><text x="14" y="12" text-anchor="middle" font-size="7" font-weight="700" font-family="sans-serif" fill="#1dcf9f">OPay</text></svg>'),
     'palmpay': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#8b5cf6" opacity="0.2"/><text x="14" y="12" text-anchor="middle" font-size="8" font-weight="700" font-family="sans-serif" fill="#8b5cf6">P</text></svg>'),
     'm-pesa': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#4caf50" opacity="0.2"/><text x="14" y="12" text-anchor="middle" font-size="8" font-weight="700" font-family="sans-serif" fill="#4caf50">M</text></svg>'),
-    'mpesa': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#4caf50" opacity="0.2"/><text x="14" y="12" text-anchor="middle" font-size="8" font-weight="700" font-family="sans-serif" fill="#4caf50">M</text></svg>'),
     'mtn-mobile-money': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#ffcc00" opacity="0.25"/><text x="14" y="12" text-anchor="middle" font-size="6" font-weight="700" font-family="sans-serif" fill="#996600">MTN</text></svg>'),
-    'mtn': Markup('<svg width="28" height="18" viewBox="0 0 28 18" fill="none" xmlns="http://www.w3.org/2000/svg"><circle cx="14" cy="9" r="7" fill="#ffcc00" opacity="0.25"/><text x="14" y="12" text-anchor="middle" font-size="6" font-weight="700" font-family="sans-serif" fill="#996600">MTN</text></svg>'),
 }
+# Alternate slugs share the canonical icon object
+_PAYMENT_ICONS['mpesa'] = _PAYMENT_ICONS['m-pesa']
+_PAYMENT_ICONS['mtn'] = _PAYMENT_ICONS['mtn-mobile-money']
+# Read-only view: the same mapping goes into every page context
+PAYMENT_ICON_MAP = MappingProxyType(_PAYMENT_ICONS)
+
+
+def _generate(template, context):
+    """Template.generate() for a context that is already built."""
+    try:
+        yield from template.root_render_func(context)
+    except Exception:
+        yield template.environment.handle_exception()
+
+
+def _render_to_file(job):
+    """Render one (template, common_ctx, ctx, output_file) job to disk.
+
+    ctx holds only the page's own keys, which win over common_ctx. The
+    render context is a ChainMap over ctx, common_ctx and the template
+    globals, so neither dict is copied per page. The page is streamed to
+    the file as it renders, so a large page is never held in memory as
+    one string. It is streamed to a .tmp sibling and moved into place, so
+    a template error never leaves a truncated page.
+    """
+    template, common_ctx, ctx, output_file = job
+    context = template.new_context(ChainMap(ctx, common_ctx, template.globals), shared=True)
+    tmp_file = output_file + '.tmp'
+    try:
+        TemplateStream(_generate(template, context)).dump(tmp_file, encoding='utf-8')
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _write_text(path, text):
+    """Write text to path as UTF-8 bytes in one binary write.
+
+    Skips the text layer's incremental encoder and newline handling;
+    rendered pages are written whole anyway.
+    """
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+
+def _clone_or_copy(src, dst):
+    """Copy src to dst as a copy-on-write clone where the filesystem allows.
+
+    On btrfs/XFS (FICLONE) the clone shares extents with src, so no bytes
+    are copied, yet later writes to either file stay private; built
+    versions stay snapshots even when an upload is re-saved in place.
+    Anywhere else this is shutil.copy2.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    shutil.copy2(src, dst)
+    return dst
 
 
 def _get_site_templates_path():
@@ -65,59 +155,79 @@ def _get_site_templates_path():
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'site_templates')
 
 
+_jinja_env = None
+
+
 def _get_jinja_env():
-    """Create a Jinja2 Environment for site templates (NOT Flask's)."""
-    templates_path = _get_site_templates_path()
-    return jinja2.Environment(
-        loader=jinja2.FileSystemLoader(templates_path),
-        autoescape=jinja2.select_autoescape(['html', 'xml']),
-    )
+    """Return the shared Jinja2 Environment for site templates (NOT Flask's).
+
+    Created once per process so compiled templates are reused across
+    builds. auto_reload is off: site templates only change on deploy.
+    Compiled templates are also kept on disk (Jinja's per-user temp
+    cache, keyed on the template source), so a fresh process skips the
+    parse and compile.
+    """
+    global _jinja_env
+    if _jinja_env is None:
+        _jinja_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(_get_site_templates_path()),
+            autoescape=jinja2.select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        )
+    return _jinja_env
+
+
+def _evergreen_path(page):
+    """Evergreen pages nest under their cluster parent when they have one."""
+    if page.nav_parent_id and page.nav_parent:
+        return f'{page.nav_parent.slug}/{page.slug}'
+    return f'{page.slug}'
+
+
+# Page type slug -> site-relative path (no leading slash) for a page.
+# Shared by nav links and the sitemap; types missing here get no
+# sitemap entry and link to /<slug>.
+_PAGE_PATHS = {
+    'homepage': lambda page: '',
+    'comparison': lambda page: f'{page.slug}',
+    'evergreen': _evergreen_path,
+    'brand-review': lambda page: f'reviews/{page.slug}',
+    'bonus-review': lambda page: f'bonuses/{page.slug}',
+    'news': lambda page: 'news',
+    'news-article': lambda page: f'news/{page.slug}',
+    'tips': lambda page: 'tips',
+    'tips-article': lambda page: f'tips/{page.slug}',
+    'odds-hub': lambda page: 'odds',
+}
 
 
 def _page_url_for_link(page):
     """Return the absolute URL string for a page, used in nav/footer links."""
-    pt_slug = page.page_type.slug
-    if pt_slug == 'homepage':
-        return '/'
-    elif pt_slug == 'comparison':
-        return f'/{page.slug}'
-    elif pt_slug == 'evergreen':
-        if page.nav_parent_id and page.nav_parent:
-            return f'/{page.nav_parent.slug}/{page.slug}'
-        return f'/{page.slug}'
-    elif pt_slug == 'brand-review':
-        return f'/reviews/{page.slug}'
-    elif pt_slug == 'bonus-review':
-        return f'/bonuses/{page.slug}'
-    elif pt_slug == 'news':
-        return '/news'
-    elif pt_slug == 'news-article':
-        return f'/news/{page.slug}'
-    elif pt_slug == 'tips':
-        return '/tips'
-    elif pt_slug == 'tips-article':
-        return f'/tips/{page.slug}'
-    elif pt_slug == 'odds-hub':
-        return '/odds'
-    return f'/{page.slug}'
-
-
-def _page_display_title(page):
+    path = _PAGE_PATHS.get(page.page_type.slug)
+    return f'/{path(page) if path else page.slug}'
+
+
+def _page_display_title(page, content=None):
     """Return a human-readable title for a page.
 
     Prefers nav_label, then hero_title from AI-generated content, then
     page.title. Falls back to a humanised slug if everything else is slug-like.
+    content is the page's already-parsed content_json, when the caller has
+    it; otherwise the blob is parsed here.
     """
     if page.nav_label:
         return page.nav_label
     # Try AI-generated hero_title from content_json
-    if page.content_json:
+    if content is None and page.content_json:
         try:
-            hero = json.loads(page.content_json).get('hero_title')
-            if hero:
-                return hero
+            content = loads(page.content_json)
         except (json.JSONDecodeError, TypeError):
-            pass
+            content = None
+    if content:
+        hero = content.get('hero_title')
+        if hero:
+            return hero
     return page.title or page.slug
 
 
@@ -133,23 +243,25 @@ def _build_nav_links(site_pages):
     """
     links = []
 
-    top_level_pages = [p for p in site_pages if p.show_in_nav and p.nav_parent_id is None]
-    child_pages = [p for p in site_pages if p.show_in_nav and p.nav_parent_id is not None]
-
-    if top_level_pages or child_pages:
-        # Group children by parent
-        children_by_parent = {}
-        for p in child_pages:
-            children_by_parent.setdefault(p.nav_parent_id, []).append(p)
+    # One pass: top-level nav pages, and nav children grouped by parent
+    top_level_pages = []
+    children_by_parent = {}
+    for p in site_pages:
+        if p.show_in_nav:
+            if p.nav_parent_id is None:
+                top_level_pages.append(p)
+            else:
+                children_by_parent.setdefault(p.nav_parent_id, []).append(p)
 
-        top_level_pages.sort(key=lambda p: (p.nav_order, p.id))
+    if top_level_pages or children_by_parent:
+        top_level_pages.sort(key=attrgetter('nav_order', 'id'))
 
         for p in top_level_pages:
             entry = {'url': _page_url_for_link(p), 'label': p.nav_label or p.title, 'type': p.page_type.slug}
 
-            kids = children_by_parent.get(p.id, [])
+            kids = children_by_parent.get(p.id)
             if kids:
-                kids.sort(key=lambda c: (c.nav_order, c.id))
+                kids.sort(key=attrgetter('nav_order', 'id'))
                 entry['children'] = [
                     {'url': _page_url_for_link(c), 'label': c.nav_label or c.title, 'type': c.page_type.slug}
                     for c in kids
@@ -157,12 +269,20 @@ def _build_nav_links(site_pages):
 
             links.append(entry)
     else:
-        # Legacy fallback for unconfigured sites
-        comparison = [p for p in site_pages if p.page_type.slug == 'comparison']
-        if comparison:
-            links.append({'url': f'/{comparison[0].slug}', 'label': 'Compare', 'type': 'comparison'})
+        # Legacy fallback for unconfigured sites: first comparison page,
+        # then every evergreen page, gathered in one pass
+        comparison = None
+        evergreen = []
+        for p in site_pages:
+            pt_slug = p.page_type.slug
+            if pt_slug == 'comparison':
+                if comparison is None:
+                    comparison = p
+            elif pt_slug == 'evergreen':
+                evergreen.append(p)
+        if comparison is not None:
+            links.append({'url': f'/{comparison.slug}', 'label': 'Compare', 'type': 'comparison'})
 
-        evergreen = [p for p in site_pages if p.page_type.slug == 'evergreen']
         for p in evergreen:
             links.append({'url': f'/{p.slug}', 'label': p.title, 'type': 'evergreen'})
 
@@ -180,7 +300,7 @@ def _build_footer_links(site_pages):
     if not footer_pages:
         return None
 
-    footer_pages.sort(key=lambda p: (p.nav_order, p.id))
+    footer_pages.sort(key=attrgetter('nav_order', 'id'))
 
     brand_reviews = []
     guides = []
@@ -205,27 +325,61 @@ def _build_footer_links(site_pages):
     }
 
 
-def _build_brand_info_list(site, geo):
+def _brand_geo_for(brand, geo, brand_geos=None):
+    """Return the brand's BrandGeo row for geo, or None.
+
+    brand_geos is an optional brand id -> row dict shared across calls
+    for the same geo (one build), so each brand's rows are scanned once.
+    """
+    if brand_geos is not None and brand.id in brand_geos:
+        return brand_geos[brand.id]
+    bg = next((bg for bg in brand.brand_geos if bg.geo_id == geo.id), None)
+    if brand_geos is not None:
+        brand_geos[brand.id] = bg
+    return bg
+
+
+# BrandGeo columns copied as-is into a brand info dict (None without a BrandGeo)
+_BRAND_GEO_FIELDS = (
+    'license_info', 'payment_methods', 'withdrawal_timeframe',
+    'rating_bonus', 'rating_usability', 'rating_mobile_app', 'rating_payments',
+    'rating_support', 'rating_licensing', 'rating_rewards',
+)
+_get_brand_geo_fields = attrgetter(*_BRAND_GEO_FIELDS)
+_NO_BRAND_GEO = (None,) * len(_BRAND_GEO_FIELDS)
+
+
+def _build_brand_info_list(site, geo, brand_geos=None):
     """Build a list of brand info dicts for template use.
 
     Merges three layers: brand (global) → brand_geo (GEO-specific) → override (site-specific).
     Null override fields fall back to the base value.
     """
     brands = []
-    for sb in sorted(site.site_brands, key=lambda sb: sb.rank):
+    # site_brands loads in rank order; sorting again only costs a linear
+    # pass and still covers ranks edited since the collection loaded
+    for sb in sorted(site.site_brands, key=attrgetter('rank')):
         brand = sb.brand
-        bg = next((bg for bg in brand.brand_geos if bg.geo_id == geo.id), None)
+        bg = _brand_geo_for(brand, geo, brand_geos)
         ov = sb.override  # SiteBrandOverride or None
 
-        brands.append({
+        # Read each layer once; `ov and ov.x` is None without an override
+        if bg is not None:
+            bg_bonus, bg_code = bg.welcome_bonus, bg.bonus_code
+            geo_values = _get_brand_geo_fields(bg)
+        else:
+            bg_bonus = bg_code = None
+            geo_values = _NO_BRAND_GEO
+
+        info = {
             'name': brand.name,
             'slug': brand.slug,
             'logo_filename': brand.logo_filename,
-            'affiliate_link': (ov.custom_affiliate_link if ov and ov.custom_affiliate_link else None) or brand.affiliate_link or '#',
+            'affiliate_link': (ov and ov.custom_affiliate_link) or brand.affiliate_link or '#',
             'website_url': brand.website_url or '#',
             'rating': brand.rating,
-            'welcome_bonus': (ov.custom_welcome_bonus if ov and ov.custom_welcome_bonus else None) or (bg.welcome_bonus if bg else None),
-            'bonus_code': (ov.custom_bonus_code if ov and ov.custom_bonus_code else None) or (bg.bonus_code if bg else None),
+            'welcome_bonus': (ov and ov.custom_welcome_bonus) or bg_bonus,
+            'bonus_code': (ov and ov.custom_bonus_code) or bg_code,
             'rank': sb.rank,
             'founded_year': brand.founded_year,
             'parent_company': brand.parent_company,
@@ -234,18 +388,10 @@ def _build_brand_info_list(site, geo):
             'available_languages': brand.available_languages,
             'has_ios_app': brand.has_ios_app,
             'has_android_app': brand.has_android_app,
-            'description': (ov.custom_description if ov and ov.custom_description else None) or brand.description,
-            'license_info': bg.license_info if bg else None,
-            'payment_methods': bg.payment_methods if bg else None,
-            'withdrawal_timeframe': bg.withdrawal_timeframe if bg else None,
-            'rating_bonus': bg.rating_bonus if bg else None,
-            'rating_usability': bg.rating_usability if bg else None,
-            'rating_mobile_app': bg.rating_mobile_app if bg else None,
-            'rating_payments': bg.rating_payments if bg else None,
-            'rating_support': bg.rating_support if bg else None,
-            'rating_licensing': bg.rating_licensing if bg else None,
-            'rating_rewards': bg.rating_rewards if bg else None,
-        })
+            'description': (ov and ov.custom_description) or brand.description,
+        }
+        info.update(zip(_BRAND_GEO_FIELDS, geo_values))
+        brands.append(info)
     return brands
 
 
@@ -258,48 +404,41 @@ def _build_brand_lookup(brand_info_list):
     return lookup
 
 
+@functools.lru_cache(maxsize=1024)
+def _display_day(day):
+    """'04 Mar 2025' for a date.
+
+    Keyed on the day rather than the datetime: article timestamps are all
+    distinct, but a site's articles fall on far fewer days.
+    """
+    return day.strftime('%d %b %Y')
+
+
+def _display_date(dt):
+    """Display date for an article datetime, or '' when it has none."""
+    return _display_day(dt.date()) if dt else ''
+
+
 def _build_sitemap_pages(site_pages, domain):
     """Build sitemap page entries."""
     now = datetime.now(timezone.utc).strftime('%Y-%m-%d')
     pages = []
 
     for page in site_pages:
-        pt_slug = page.page_type.slug
-        if pt_slug == 'homepage':
-            url = ''
-        elif pt_slug == 'comparison':
-            url = page.slug
-        elif pt_slug == 'brand-review':
-            url = f'reviews/{page.slug}'
-        elif pt_slug == 'bonus-review':
-            url = f'bonuses/{page.slug}'
-        elif pt_slug == 'news':
-            url = 'news'
-        elif pt_slug == 'news-article':
-            url = f'news/{page.slug}'
-        elif pt_slug == 'tips':
-            url = 'tips'
-        elif pt_slug == 'tips-article':
-            url = f'tips/{page.slug}'
-        elif pt_slug == 'evergreen':
-            if page.nav_parent_id and page.nav_parent:
-                url = f'{page.nav_parent.slug}/{page.slug}'
-            else:
-                url = f'{page.slug}'
-        elif pt_slug == 'odds-hub':
-            url = 'odds'
-        else:
+        path = _PAGE_PATHS.get(page.page_type.slug)
+        if path is None:
             continue
+        url = path(page)
 
         pages.append({
             'url': url,
-            'lastmod': page.generated_at.strftime('%Y-%m-%d') if page.generated_at else now,
+            'lastmod': page.generated_at.date().isoformat() if page.generated_at else now,
         })
 
     return pages
 
 
-def _build_cta_table_data(cta_table, brand_info_list, geo):
+def _build_cta_table_data(cta_table, brand_info_list, geo, brand_geos=None):
     """Build CTA table data dict for template rendering.
 
     Includes full brand info so cards render correctly even when
@@ -312,7 +451,7 @@ def _build_cta_table_data(cta_table, brand_info_list, geo):
             continue
         brand = row.brand
         brand_info = brand_map.get(brand.slug, {})
-        bg = next((bg for bg in brand.brand_geos if bg.geo_id == geo.id), None)
+        bg = _brand_geo_for(brand, geo, brand_geos)
         rows.append({
             'rank': row.rank,
             'brand': {
@@ -342,24 +481,50 @@ def _build_cta_table_data(cta_table, brand_info_list, geo):
     }
 
 
+def load_site_for_build(site_id):
+    """Sweep dead links, then load a Site with the relationships build_site
+    walks, or None.
+
+    Brands, overrides, pages, page types and CTA table rows arrive in a
+    handful of IN queries instead of one lazy load per row. The sweep
+    commits when it fixes a link, so it runs first; call this after any
+    other commit that precedes the build, since a commit expires the
+    loaded graph again.
+    """
+    # Auto-sweep dead internal links before building
+    from .link_sweeper import sweep_dead_links
+    sweep_result = sweep_dead_links(site_id, fix=True)
+    if sweep_result['fixed']:
+        logger.info('Pre-build sweep: fixed %d dead link(s) in %d page(s)',
+                     sweep_result['fixed'], sweep_result['pages_updated'])
+
+    return (
+        Site.query
+        .options(
+            joinedload(Site.geo), joinedload(Site.vertical), joinedload(Site.domain),
+            selectinload(Site.site_brands).joinedload(SiteBrand.brand),
+            selectinload(Site.site_brands).selectinload(SiteBrand.override),
+            selectinload(Site.site_pages).joinedload(SitePage.page_type),
+            selectinload(Site.site_pages).selectinload(SitePage.cta_table)
+            .selectinload(CTATable.rows),
+        )
+        .filter_by(id=site_id)
+        .first()
+    )
+
+
 def build_site(site, output_base_dir, upload_folder):
     """Build a complete static site from generated content.
 
     Args:
-        site: Site model instance (with relationships loaded)
+        site: Site model instance, as returned by load_site_for_build
+            (dead links swept, relationships loaded)
         output_base_dir: Base output directory (e.g. 'output/')
         upload_folder: Path to uploads/ directory (for logo copying)
 
     Returns:
         str: Path to the built site version folder
     """
-    # Auto-sweep dead internal links before building
-    from .link_sweeper import sweep_dead_links
-    sweep_result = sweep_dead_links(site.id, fix=True)
-    if sweep_result['fixed']:
-        logger.info('Pre-build sweep: fixed %d dead link(s) in %d page(s)',
-                     sweep_result['fixed'], sweep_result['pages_updated'])
-
     env = _get_jinja_env()
     geo = site.geo
     vertical = site.vertical
@@ -374,7 +539,17 @@ def build_site(site, output_base_dir, upload_folder):
     # Build shared context
     nav_links = _build_nav_links(pages)
     footer_links = _build_footer_links(pages)
-    brand_info_list = _build_brand_info_list(site, geo)
+    # brand id -> BrandGeo for this site's geo (None if the brand has no
+    # row for it): one query for all site brands instead of loading each
+    # brand's brand_geos collection. CTA-only brands fill in lazily.
+    brand_geos = dict.fromkeys(sb.brand_id for sb in site.site_brands)
+    if brand_geos:
+        brand_geos.update(
+            (bg.brand_id, bg) for bg in BrandGeo.query.filter(
+                BrandGeo.geo_id == geo.id, BrandGeo.brand_id.in_(list(brand_geos)),
+            )
+        )
+    brand_info_list = _build_brand_info_list(site, geo, brand_geos)
     brand_lookup = _build_brand_lookup(brand_info_list)
     domain = site.domain.domain if site.domain else 'example.com'
 
@@ -383,6 +558,13 @@ def build_site(site, output_base_dir, upload_folder):
     for p in pages:
         if p.nav_parent_id is not None:
             cluster_map.setdefault(p.nav_parent_id, []).append(p)
+    # Every child renders its cluster's links, so sort each cluster once
+    for children in cluster_map.values():
+        children.sort(key=attrgetter('nav_order', 'id'))
+    pages_by_id = {p.id: p for p in pages}
+    # Each page's URL is needed by its own schema, every sibling's sidebar
+    # and the author listings; work it out once
+    page_urls = {p.id: _page_url_for_link(p) for p in pages}
 
     # Build sets of brand slugs that have actual pages (for conditional linking)
     review_slugs = {p.slug for p in pages if p.page_type.slug == 'brand-review'}
@@ -396,12 +578,14 @@ def build_site(site, output_base_dir, upload_folder):
             'name': a.name, 'slug': a.slug, 'role': a.role,
             'short_bio': a.short_bio, 'bio': a.bio,
             'avatar_filename': a.avatar_filename,
-            'expertise': json.loads(a.expertise) if a.expertise else [],
-            'social_links': json.loads(a.social_links) if a.social_links else {},
+            'expertise': loads(a.expertise) if a.expertise else [],
+            'social_links': loads(a.social_links) if a.social_links else {},
             'initials': ''.join(w[0] for w in a.name.split()[:2]).upper(),
-            'color': f'hsl({hash(a.name) % 360}, 45%, 45%)',
+            'color': f'hsl({zlib.crc32(a.name.encode()) % 360}, 45%, 45%)',
         }
 
+    # Shared by every page: passed to render() next to each page's own
+    # context rather than copied into it
     common_ctx = {
         'site_name': site.name,
         'language': geo.language,
@@ -429,16 +613,83 @@ def build_site(site, output_base_dir, upload_folder):
             teams_key = f'{ofx.home_team} vs {ofx.away_team}'.lower()
             odds_link_by_teams[teams_key] = url
 
-    # Render each page
+    # Load each distinct template once; the loop only indexes into this
+    templates = {
+        name: env.get_template(name)
+        for name in {p.page_type.template_file for p in pages} | {'sitemap.xml', 'robots.txt'}
+    }
+
+    # Parse every page's content once; index pages and the homepage hub
+    # read other pages' content from here instead of re-parsing it
+    parsed = {p.id: (loads(p.content_json) if p.content_json else {}) for p in pages}
+
+    # News and tips listings for the index pages and the homepage hub,
+    # built in one pass for the whole build
+    news_articles = []
+    news_preview = []
+    tips_articles = []
+    tips_preview = []
+    for p in pages:
+        if not p.content_json:
+            continue
+        p_slug = p.page_type.slug
+        if p_slug == 'news-article':
+            p_content = parsed[p.id]
+            pub_date = _display_date(p.published_date)
+            summary = p_content.get('hero_subtitle', '')
+            news_articles.append({
+                'slug': p.slug,
+                'title': p.title,
+                'published_date': pub_date,
+                'summary': summary,
+            })
+            p_author = author_map.get(p.author_id) if p.author_id else None
+            news_preview.append({
+                'slug': p.slug, 'title': p.title, 'published_date': pub_date,
+                'summary': (summary or '')[:120],
+                'author_name': p_author['name'] if p_author else None,
+            })
+        elif p_slug == 'tips-article':
+            p_content = parsed[p.id]
+            pub_date = _display_date(p.published_date)
+            match_info = p_content.get('match_info', {})
+            prediction = p_content.get('prediction', {})
+            entry = {
+                'slug': p.slug,
+                'title': p.title,
+                'published_date': pub_date,
+                'summary': p_content.get('hero_subtitle', ''),
+                'competition': match_info.get('competition', ''),
+                'match_date': match_info.get('date', pub_date),
+                'prediction_result': prediction.get('result', ''),
+                'prediction_confidence': prediction.get('confidence', ''),
+            }
+            tips_articles.append(entry)
+            # The homepage shows no match date when the tip has none
+            tips_preview.append({**entry, 'match_date': match_info.get('date', '')})
+    # Newest first
+    news_articles.sort(key=lambda a: a['published_date'], reverse=True)
+    news_preview.sort(key=lambda a: a['published_date'], reverse=True)
+    tips_articles.sort(key=lambda a: a['match_date'] or a['published_date'], reverse=True)
+    tips_preview.sort(key=lambda a: a['match_date'] or a['published_date'], reverse=True)
+
+    # Build each page's context here (all DB access stays on this thread);
+    # rendering and writing happen in a thread pool after the loop
+    render_jobs = []
+    cta_tables = {}  # cta_table_id -> template data
     for page in pages:
-        content = json.loads(page.content_json) if page.content_json else {}
+        content = parsed[page.id]
         pt_slug = page.page_type.slug
         template_file = page.page_type.template_file
 
-        # Resolve CTA table if assigned (8.2)
+        # Resolve CTA table if assigned (8.2); a table shared by several
+        # pages is built once
         cta_table_data = None
-        if page.cta_table_id and page.cta_table:
-            cta_table_data = _build_cta_table_data(page.cta_table, brand_info_list, geo)
+        if page.cta_table_id:
+            cta_table_data = cta_tables.get(page.cta_table_id)
+            if cta_table_data is None and page.cta_table:
+                cta_table_data = cta_tables[page.cta_table_id] = _build_cta_table_data(
+                    page.cta_table, brand_info_list, geo, brand_geos)
 
         # Build cluster sidebar links: if page has a parent, show siblings;
         # if page IS a parent, show its children.
@@ -447,21 +698,20 @@ def build_site(site, output_base_dir, upload_folder):
         if parent_id is not None:
             siblings = cluster_map.get(parent_id, [])
             # Include the parent page itself as the first link
-            parent_page = next((p for p in pages if p.id == parent_id), None)
+            parent_page = pages_by_id.get(parent_id)
             if parent_page and parent_page.id != page.id:
                 cluster_links.append({
-                    'url': _page_url_for_link(parent_page),
-                    'label': _page_display_title(parent_page),
+                    'url': page_urls[parent_page.id],
+                    'label': _page_display_title(parent_page, parsed[parent_page.id]),
                 })
-            for sib in sorted(siblings, key=lambda s: (s.nav_order, s.id)):
+            for sib in siblings:
                 if sib.id != page.id:
                     cluster_links.append({
-                        'url': _page_url_for_link(sib),
-                        'label': _page_display_title(sib),
+                        'url': page_urls[sib.id],
+                        'label': _page_display_title(sib, parsed[sib.id]),
                     })
 
         ctx = {
-            **common_ctx,
             'content': content,
             'page_title': page.title,
             'meta_title': page.meta_title or '',
@@ -478,61 +728,22 @@ def build_site(site, output_base_dir, upload_folder):
 
         if pt_slug == 'homepage':
             output_file = os.path.join(version_dir, 'index.html')
-            # Merge AI-generated top_brands data into site_brands for richer rendering
-            top_brands_ai = content.get('top_brands', [])
+            # AI-generated top_brands data (badges etc.), looked up by slug
+            # or name in the template so the shared brand dicts stay as-is
             ai_map = {}
-            for tb in top_brands_ai:
+            for tb in content.get('top_brands', []):
                 if tb.get('slug'):
                     ai_map[tb['slug']] = tb
                 if tb.get('name'):
                     ai_map[tb['name']] = tb
-            enriched = []
-            for b in brand_info_list:
-                merged = dict(b)
-                ai = ai_map.get(b['slug']) or ai_map.get(b['name'], {})
-                merged['selling_points'] = ai.get('selling_points', [])
-                merged['short_description'] = ai.get('short_description', '')
-                merged['feature_badges'] = ai.get('feature_badges', [])
-                enriched.append(merged)
-            ctx['site_brands'] = enriched
-            # Update brand_lookup so CTA table rows also get enriched data
-            enriched_lookup = _build_brand_lookup(enriched)
-            ctx['brand_lookup'] = enriched_lookup
+            ctx['brand_ai_map'] = ai_map
 
             # --- Homepage hub data ---
 
             # Tips preview: 4 most recent tips-articles
-            tips_preview = []
-            for p in pages:
-                if p.page_type.slug == 'tips-article' and p.content_json:
-                    p_content = json.loads(p.content_json)
-                    match_info = p_content.get('match_info', {})
-                    prediction = p_content.get('prediction', {})
-                    tips_preview.append({
-                        'slug': p.slug, 'title': p.title,
-                        'published_date': p.published_date.strftime('%d %b %Y') if p.published_date else '',
-                        'summary': p_content.get('hero_subtitle', ''),
-                        'competition': match_info.get('competition', ''),
-                        'match_date': match_info.get('date', ''),
-                        'prediction_result': prediction.get('result', ''),
-                        'prediction_confidence': prediction.get('confidence', ''),
-                    })
-            tips_preview.sort(key=lambda a: a['match_date'] or a['published_date'], reverse=True)
             ctx['tips_preview'] = tips_preview[:4]
 
             # News preview: 3 most recent news-articles
-            news_preview = []
-            for p in pages:
-                if p.page_type.slug == 'news-article' and p.content_json:
-                    p_content = json.loads(p.content_json)
-                    pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
-                    p_author = author_map.get(p.author_id) if p.author_id else None
-                    news_preview.append({
-                        'slug': p.slug, 'title': p.title, 'published_date': pub_date,
-                        'summary': (p_content.get('hero_subtitle', '') or '')[:120],
-                        'author_name': p_author['name'] if p_author else None,
-                    })
-            news_preview.sort(key=lambda a: a['published_date'], reverse=True)
             ctx['news_preview'] = news_preview[:3]
 
             # Authors list with article counts
@@ -600,63 +811,25 @@ def build_site(site, output_base_dir, upload_folder):
             os.makedirs(news_dir, exist_ok=True)
             output_file = os.path.join(news_dir, 'index.html')
             ctx['subdirectory'] = True
-            # Collect news articles for listing
-            news_articles = []
-            for p in pages:
-                if p.page_type.slug == 'news-article' and p.content_json:
-                    p_content = json.loads(p.content_json) if p.content_json else {}
-                    pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
-                    news_articles.append({
-                        'slug': p.slug,
-                        'title': p.title,
-                        'published_date': pub_date,
-                        'summary': p_content.get('hero_subtitle', ''),
-                    })
-            # Sort by published_date descending (newest first)
-            news_articles.sort(
-                key=lambda a: a['published_date'],
-                reverse=True,
-            )
             ctx['news_articles'] = news_articles
         elif pt_slug == 'news-article':
             news_dir = os.path.join(version_dir, 'news')
             os.makedirs(news_dir, exist_ok=True)
             output_file = os.path.join(news_dir, f'{page.slug}.html')
             ctx['subdirectory'] = True
-            ctx['published_date'] = page.published_date.strftime('%d %b %Y') if page.published_date else ''
+            ctx['published_date'] = _display_date(page.published_date)
         elif pt_slug == 'tips':
             tips_dir = os.path.join(version_dir, 'tips')
             os.makedirs(tips_dir, exist_ok=True)
             output_file = os.path.join(tips_dir, 'index.html')
             ctx['subdirectory'] = True
-            tips_articles = []
-            for p in pages:
-                if p.page_type.slug == 'tips-article' and p.content_json:
-                    p_content = json.loads(p.content_json) if p.content_json else {}
-                    pub_date = p.published_date.strftime('%d %b %Y') if p.published_date else ''
-                    match_info = p_content.get('match_info', {})
-                    prediction = p_content.get('prediction', {})
-                    tips_articles.append({
-                        'slug': p.slug,
-                        'title': p.title,
-                        'published_date': pub_date,
-                        'summary': p_content.get('hero_subtitle', ''),
-                        'competition': match_info.get('competition', ''),
-                        'match_date': match_info.get('date', pub_date),
-                        'prediction_result': prediction.get('result', ''),
-                        'prediction_confidence': prediction.get('confidence', ''),
-                    })
-            tips_articles.sort(
-                key=lambda a: a['match_date'] or a['published_date'],
-                reverse=True,
-            )
             ctx['tips_articles'] = tips_articles
         elif pt_slug == 'tips-article':
             tips_dir = os.path.join(version_dir, 'tips')
             os.makedirs(tips_dir, exist_ok=True)
             output_file = os.path.join(tips_dir, f'{page.slug}.html')
             ctx['subdirectory'] = True
-            ctx['published_date'] = page.published_date.strftime('%d %b %Y') if page.published_date else ''
+            ctx['published_date'] = _display_date(page.published_date)
             ctx['prediction'] = content.get('prediction', {})
             ctx['betting_tips'] = content.get('betting_tips', [])
             ctx['match_info'] = content.get('match_info', {})
@@ -683,20 +856,21 @@ def build_site(site, output_base_dir, upload_folder):
         ctx['page_author'] = page_author
 
         # Generate JSON-LD schema markup (8.3)
-        page_url = _build_sitemap_pages([page], domain)[0]['url'] if page else ''
+        page_url = page_urls[page.id]
         brand_info_for_schema = ctx.get('brand_info')
         rating_for_schema = brand_info_for_schema.get('rating') if brand_info_for_schema else None
         ctx['schema_json_ld'] = generate_schema(
             pt_slug, content, page.title, site.name, domain,
-            f'/{page_url}', brand_info=brand_info_for_schema,
+            page_url, brand_info=brand_info_for_schema,
             rating=rating_for_schema, generated_at=page.generated_at,
             author_info=page_author,
         )
 
-        template = env.get_template(template_file)
-        html = template.render(**ctx)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        render_jobs.append((templates[template_file], common_ctx, ctx, output_file))
+
+    with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+        # list() re-raises the first render error, as the serial loop did
+        list(executor.map(_render_to_file, render_jobs))
 
     # Generate author pages
     if authors:
@@ -707,9 +881,9 @@ def build_site(site, output_base_dir, upload_folder):
                 date = p.published_date or p.generated_at
                 author_articles.setdefault(p.author_id, []).append({
                     'title': p.title, 'slug': p.slug,
-                    'url': _page_url_for_link(p).lstrip('/'),
+                    'url': page_urls[p.id].lstrip('/'),
                     'type': p.page_type.slug,
-                    'published_date': date.strftime('%d %b %Y') if date else '',
+                    'published_date': _display_date(date),
                 })
 
         authors_dir = os.path.join(version_dir, 'authors')
@@ -719,7 +893,6 @@ def build_site(site, output_base_dir, upload_folder):
             info = author_map[a.id]
             author_url = f'/authors/{a.slug}'
             author_ctx = {
-                **common_ctx,
                 'author': info,
                 'author_articles': author_articles.get(a.id, []),
                 'subdirectory': True,
@@ -732,9 +905,8 @@ def build_site(site, output_base_dir, upload_folder):
                     'author', info, a.name, site.name, domain, author_url,
                 ),
             }
-            html = env.get_template('author.html').render(**author_ctx)
-            with open(os.path.join(authors_dir, f'{a.slug}.html'), 'w', encoding='utf-8') as f:
-                f.write(html)
+            _render_to_file((env.get_template('author.html'), common_ctx, author_ctx,
+                             os.path.join(authors_dir, f'{a.slug}.html')))
 
         author_list = []
         for a in authors:
@@ -743,7 +915,6 @@ def build_site(site, output_base_dir, upload_folder):
             author_list.append(entry)
 
         landing_ctx = {
-            **common_ctx,
             'authors_list': author_list,
             'subdirectory': True,
             'page_title': 'Our Experts',
@@ -753,9 +924,8 @@ def build_site(site, output_base_dir, upload_folder):
             'custom_head': site.custom_head or '',
             'schema_json_ld': '',
         }
-        html = env.get_template('authors.html').render(**landing_ctx)
-        with open(os.path.join(authors_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html)
+        _render_to_file((env.get_template('authors.html'), common_ctx, landing_ctx,
+                         os.path.join(authors_dir, 'index.html')))
 
     # ── Generate odds comparison pages ──────────────────────────────────
     odds_sitemap_pages = _build_odds_pages(
@@ -768,17 +938,22 @@ def build_site(site, output_base_dir, upload_folder):
     dst_assets = os.path.join(version_dir, 'assets')
     if os.path.exists(dst_assets):
         shutil.rmtree(dst_assets)
-    shutil.copytree(src_assets, dst_assets)
+    shutil.copytree(src_assets, dst_assets, copy_function=_clone_or_copy)
 
     # Copy brand logos
     logos_dir = os.path.join(dst_assets, 'logos')
     os.makedirs(logos_dir, exist_ok=True)
     src_logos = os.path.join(upload_folder, 'logos')
+    # One directory listing instead of a stat per brand
+    try:
+        with os.scandir(src_logos) as it:
+            available_logos = {e.name for e in it}
+    except FileNotFoundError:
+        available_logos = set()
     for brand_info in brand_info_list:
-        if brand_info['logo_filename']:
-            src = os.path.join(src_logos, brand_info['logo_filename'])
-            if os.path.exists(src):
-                shutil.copy2(src, os.path.join(logos_dir, brand_info['logo_filename']))
+        logo = brand_info['logo_filename']
+        if logo and logo in available_logos:
+            _clone_or_copy(os.path.join(src_logos, logo), os.path.join(logos_dir, logo))
 
     # Copy author avatars
     if authors:
@@ -790,12 +965,11 @@ def build_site(site, output_base_dir, upload_folder):
                 if a.avatar_filename:
                     src = os.path.join(avatars_src, a.avatar_filename)
                     if os.path.exists(src):
-                        shutil.copy2(src, os.path.join(avatars_dst, a.avatar_filename))
+                        _clone_or_copy(src, os.path.join(avatars_dst, a.avatar_filename))
 
     # Generate favicon
     favicon_svg = _generate_favicon_svg(site.name, vertical.slug)
-    with open(os.path.join(version_dir, 'favicon.svg'), 'w', encoding='utf-8') as f:
-        f.write(favicon_svg)
+    _write_text(os.path.join(version_dir, 'favicon.svg'), favicon_svg)
 
     # Generate sitemap.xml
     sitemap_pages = _build_sitemap_pages(pages, domain)
@@ -809,19 +983,15 @@ def build_site(site, output_base_dir, upload_folder):
     # Add odds pages to sitemap
     sitemap_pages.extend(odds_sitemap_pages)
 
-    sitemap_template = env.get_template('sitemap.xml')
-    sitemap_html = sitemap_template.render(domain=domain, pages=sitemap_pages)
-    with open(os.path.join(version_dir, 'sitemap.xml'), 'w', encoding='utf-8') as f:
-        f.write(sitemap_html)
+    _render_to_file((templates['sitemap.xml'], {}, {'domain': domain, 'pages': sitemap_pages},
+                     os.path.join(version_dir, 'sitemap.xml')))
 
     # Generate robots.txt
     if site.custom_robots_txt:
         robots_txt = site.custom_robots_txt
     else:
-        robots_template = env.get_template('robots.txt')
-        robots_txt = robots_template.render(domain=domain)
-    with open(os.path.join(version_dir, 'robots.txt'), 'w', encoding='utf-8') as f:
-        f.write(robots_txt)
+        robots_txt = templates['robots.txt'].render(domain=domain)
+    _write_text(os.path.join(version_dir, 'robots.txt'), robots_txt)
 
     # Update site record
     site.output_path = version_dir
@@ -1051,7 +1221,6 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
         schema = _sports_event_schema(fx, site.name, domain)
 
         fixture_ctx = {
-            **common_ctx,
             'fixture_data': fx_display,
             'market_tables': market_tables,
             'tips_article_url': tips_url,
@@ -1073,10 +1242,8 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
             'page_slug': f'odds-{fx.slug}',
         }
 
-        html = env.get_template('odds_fixture.html').render(**fixture_ctx)
-        output_file = os.path.join(league_dir, f'{fx.slug}.html')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        _render_to_file((env.get_template('odds_fixture.html'), common_ctx, fixture_ctx,
+                         os.path.join(league_dir, f'{fx.slug}.html')))
 
         sitemap_entries.append({
             'url': f'odds/{fx.league_slug}/{fx.slug}',
@@ -1092,7 +1259,6 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
         fx_displays = [_fixture_display(fx) for fx in league_fixtures]
 
         league_ctx = {
-            **common_ctx,
             'league_name': info['name'],
             'league_slug': league_slug,
             'league_fixtures': fx_displays,
@@ -1111,9 +1277,8 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
             'page_slug': f'odds-{league_slug}',
         }
 
-        html = env.get_template('odds_league.html').render(**league_ctx)
-        with open(os.path.join(odds_dir, f'{league_slug}.html'), 'w', encoding='utf-8') as f:
-            f.write(html)
+        _render_to_file((env.get_template('odds_league.html'), common_ctx, league_ctx,
+                         os.path.join(odds_dir, f'{league_slug}.html')))
 
         sitemap_entries.append({
             'url': f'odds/{league_slug}',
@@ -1128,7 +1293,6 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
     }
 
     hub_ctx = {
-        **common_ctx,
         'odds_leagues': odds_leagues,
         'odds_by_league': odds_by_league,
         'odds_fixtures': odds_fixtures,
@@ -1147,11 +1311,10 @@ def _build_odds_pages(env, site, common_ctx, brand_info_list, brand_lookup,
         'subdirectory': True,
     }
 
-    html = env.get_template('odds_hub.html').render(**hub_ctx)
     odds_hub_dir = os.path.join(version_dir, 'odds')
     os.makedirs(odds_hub_dir, exist_ok=True)
-    with open(os.path.join(odds_hub_dir, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html)
+    _render_to_file((env.get_template('odds_hub.html'), common_ctx, hub_ctx,
+                     os.path.join(odds_hub_dir, 'index.html')))
 
     sitemap_entries.append({'url': 'odds', 'lastmod': now_str})
 
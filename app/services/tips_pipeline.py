@@ -9,19 +9,84 @@ import json
 import logging
 import os
 import re
+import subprocess
+import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
+from ._json import dumps
+
 logger = logging.getLogger(__name__)
 
 
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+# Whitespace, underscores and dashes in any mix collapse to one dash
+_SLUG_SEP_RE = re.compile(r'[\s_-]+')
+
+
 def _slugify(text):
     """Convert text to a URL-safe slug."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
-    return text.strip('-')
+    text = _SLUG_STRIP_RE.sub('', text.lower().strip())
+    return _SLUG_SEP_RE.sub('-', text).strip('-')
+
+
+# Tips pages inserted per transaction. A failure partway through a run
+# keeps every batch committed before it.
+TIPS_COMMIT_BATCH = 5
+
+# PageType slug -> id. Page types are seed data, so a found id stays valid
+# for the life of the process; the cron script reuses it for every site.
+_page_type_ids = {}
+
+
+def _page_type_id(slug):
+    """Id of the PageType with this slug, or None if it isn't seeded yet."""
+    pt_id = _page_type_ids.get(slug)
+    if pt_id is None:
+        from ..models import PageType
+        pt = PageType.query.filter_by(slug=slug).first()
+        if pt is not None:
+            pt_id = _page_type_ids[slug] = pt.id
+    return pt_id
+
+
+def _fixture_title(fixture):
+    """Page title for an API-Football fixture, e.g. 'Arsenal vs Chelsea'."""
+    teams = fixture.get('teams', {})
+    home_name = teams.get('home', {}).get('name', 'Home')
+    away_name = teams.get('away', {}).get('name', 'Away')
+    return f"{home_name} vs {away_name}"
+
+
+def _fixture_slug(fixture, today):
+    """Date-prefixed slug for a fixture, e.g. '2025-03-01-arsenal-vs-chelsea'.
+
+    today ('YYYY-MM-DD') is the prefix when the fixture has no usable date.
+    """
+    match_date_str = fixture.get('fixture', {}).get('date', '')
+    try:
+        match_date = datetime.fromisoformat(match_date_str.replace('Z', '+00:00'))
+        date_prefix = match_date.date().isoformat()
+    except (ValueError, AttributeError):
+        date_prefix = today
+    return _slugify(f"{date_prefix}-{_fixture_title(fixture)}")
+
+
+def _fetch_match_data(client, item):
+    """Build the match data package for one fixture as a JSON string.
+
+    Network only (H2H, odds, stats — 3 API calls), so it is safe to run
+    in a worker thread.
+    """
+    from .api_football import build_match_data_package
+    match_data = build_match_data_package(
+        client, item['fixture'], item['league_id'], item['season'])
+
+    # Add league name context. Every value comes from decoded JSON, so the
+    # package serialises without a default= fallback.
+    match_data['league_name'] = item['league_name']
+    return dumps(match_data)
 
 
 def fetch_and_generate_tips(site_id, app=None):
@@ -34,10 +99,12 @@ def fetch_and_generate_tips(site_id, app=None):
     Returns:
         int: Number of new tips pages created
     """
-    from ..models import db, Site, SitePage, PageType
+    from ..models import db, Site, SitePage
     from .api_football import APIFootballClient, RateLimitError
-    from .content_generator import build_prompt, call_openai, save_content_to_page
-    from .site_builder import build_site
+    from .content_generator import (
+        build_prompt, call_openai, save_content_to_page, PAGE_TYPE_SCHEMAS,
+    )
+    from .site_builder import build_site, load_site_for_build
 
     site = db.session.get(Site, site_id)
     if not site:
@@ -63,12 +130,14 @@ def fetch_and_generate_tips(site_id, app=None):
         openai_key = app.config.get('OPENAI_API_KEY', '')
         openai_model = app.config.get('OPENAI_MODEL', 'gpt-4o-mini')
         max_matches = app.config.get('TIPS_MAX_MATCHES_PER_DAY', 20)
+        tips_concurrency = app.config.get('TIPS_CONCURRENCY', 5)
     else:
         from flask import current_app
         api_football_key = current_app.config.get('API_FOOTBALL_KEY', '')
         openai_key = current_app.config.get('OPENAI_API_KEY', '')
         openai_model = current_app.config.get('OPENAI_MODEL', 'gpt-4o-mini')
         max_matches = current_app.config.get('TIPS_MAX_MATCHES_PER_DAY', 20)
+        tips_concurrency = current_app.config.get('TIPS_CONCURRENCY', 5)
 
     if not api_football_key:
         logger.error('API_FOOTBALL_KEY not configured')
@@ -78,9 +147,9 @@ def fetch_and_generate_tips(site_id, app=None):
         return 0
 
     # Get tips page types
-    tips_article_pt = PageType.query.filter_by(slug='tips-article').first()
-    tips_landing_pt = PageType.query.filter_by(slug='tips').first()
-    if not tips_article_pt:
+    tips_article_pt_id = _page_type_id('tips-article')
+    tips_landing_pt_id = _page_type_id('tips')
+    if not tips_article_pt_id:
         logger.error('tips-article PageType not found — run seed')
         return 0
 
@@ -94,20 +163,25 @@ def fetch_and_generate_tips(site_id, app=None):
 
     # Find tips landing page (for nav_parent_id)
     tips_landing = SitePage.query.filter_by(
-        site_id=site_id, page_type_id=tips_landing_pt.id
-    ).first() if tips_landing_pt else None
+        site_id=site_id, page_type_id=tips_landing_pt_id
+    ).first() if tips_landing_pt_id else None
 
     geo = site.geo
     vertical = site.vertical
     client = APIFootballClient(api_football_key)
 
-    created_count = 0
+    # One clock reading per run: every tip from this run shares its
+    # published_date, and slugs without a match date share today's prefix
+    now = datetime.now(timezone.utc)
+    local_now = datetime.now()
+    today = local_now.strftime('%Y-%m-%d')
+
     all_fixtures = []
 
     # Step 1: Fetch fixtures for all leagues
     for league_config in leagues:
         league_id = league_config.get('league_id')
-        season = league_config.get('season', datetime.now().year)
+        season = league_config.get('season', local_now.year)
         league_name = league_config.get('name', f'League {league_id}')
 
         if not league_id:
@@ -138,96 +212,149 @@ def fetch_and_generate_tips(site_id, app=None):
     all_fixtures = all_fixtures[:max_matches]
     logger.info('Processing %d new fixtures for site %d', len(all_fixtures), site_id)
 
-    # Step 2: For each fixture, build data package + generate content
-    for item in all_fixtures:
-        fixture = item['fixture']
-        league_id = item['league_id']
-        season = item['season']
-        league_name = item['league_name']
-
-        fixture_data = fixture.get('fixture', {})
-        fixture_id = fixture_data.get('id')
-        home_team = fixture.get('teams', {}).get('home', {})
-        away_team = fixture.get('teams', {}).get('away', {})
-        home_name = home_team.get('name', 'Home')
-        away_name = away_team.get('name', 'Away')
-
-        # Build date-prefixed slug
-        match_date_str = fixture_data.get('date', '')
-        try:
-            match_date = datetime.fromisoformat(match_date_str.replace('Z', '+00:00'))
-            date_prefix = match_date.strftime('%Y-%m-%d')
-        except (ValueError, AttributeError):
-            date_prefix = datetime.now().strftime('%Y-%m-%d')
-            match_date = datetime.now(timezone.utc)
-
-        slug = _slugify(f"{date_prefix}-{home_name}-vs-{away_name}")
-        title = f"{home_name} vs {away_name}"
-
+    # Step 2: Fetch match data packages concurrently (API-Football only —
+    # no DB access in workers)
+    fetched = []
+    if all_fixtures:
+        with ThreadPoolExecutor(max_workers=tips_concurrency) as executor:
+            futures = {
+                executor.submit(_fetch_match_data, client, item): item
+                for item in all_fixtures
+            }
+            handled = set()
+            for future in as_completed(futures):
+                handled.add(future)
+                item = futures[future]
+                try:
+                    fetched.append((item, future.result()))
+                except RateLimitError:
+                    logger.warning('Rate limit reached after fetching %d match packages',
+                                   len(fetched))
+                    for f in futures:
+                        f.cancel()
+                    break
+                except Exception as e:
+                    logger.error('Failed to fetch match data for %s: %s',
+                                 _fixture_title(item['fixture']), e)
+
+        # Keep packages that were already in flight when the limit was hit
+        # (leaving the with block waited for them)
+        for future, item in futures.items():
+            if future in handled or future.cancelled():
+                continue
+            try:
+                fetched.append((item, future.result()))
+            except Exception:
+                pass
+
+    # Step 3: Build prompts (reads geo/vertical — single thread)
+    fixture_prompts = []
+    for item, match_data_json in fetched:
+        prompt = build_prompt(
+            'tips-article', geo, vertical,
+            evergreen_topic=_fixture_title(item['fixture']),
+            match_data=match_data_json,
+        )
+        fixture_prompts.append((item, prompt))
+
+    # Step 4: Generate content concurrently; pages are created on this
+    # thread and committed TIPS_COMMIT_BATCH at a time as calls complete
+    def _call_api(prompt):
+        return call_openai(
+            prompt, openai_key, openai_model,
+            schema=PAGE_TYPE_SCHEMAS['tips-article'], schema_name='tips-article',
+        )
+
+    def _add_page(fixture, content_data):
+        title = _fixture_title(fixture)
+        page = SitePage(
+            site_id=site_id,
+            page_type_id=tips_article_pt_id,
+            evergreen_topic=title,
+            slug=_fixture_slug(fixture, today),
+            title=title,
+            fixture_id=fixture.get('fixture', {}).get('id'),
+            published_date=now,
+            show_in_nav=False,
+            show_in_footer=False,
+            nav_order=0,
+        )
+        if tips_landing:
+            page.nav_parent_id = tips_landing.id
+
+        # Auto-assign default author if set
+        if site.default_author_id:
+            page.author_id = site.default_author_id
+
+        db.session.add(page)
+        save_content_to_page(page, content_data, db.session)
+
+    def _commit_batch(batch):
+        """Commit (fixture, content_data) pairs in one transaction.
+
+        If that fails (e.g. a unique-index clash), fall back to one
+        transaction per page so only the offending tips are lost.
+        Returns the pairs that were saved. A clash can surface while the
+        pages are still being added (an autoflush), not only on commit.
+        """
         try:
-            # Build match data package (H2H, odds, stats — 3 API calls)
-            from .api_football import build_match_data_package
-            match_data = build_match_data_package(client, fixture, league_id, season)
-
-            # Add league name context
-            match_data['league_name'] = league_name
-
-            # Generate AI content
-            match_data_json = json.dumps(match_data, default=str)
-            prompt = build_prompt(
-                'tips-article', geo, vertical,
-                evergreen_topic=title,
-                match_data=match_data_json,
-            )
-            content_data = call_openai(prompt, openai_key, openai_model)
-
-            # Create the SitePage
-            page = SitePage(
-                site_id=site_id,
-                page_type_id=tips_article_pt.id,
-                evergreen_topic=title,
-                slug=slug,
-                title=title,
-                fixture_id=fixture_id,
-                published_date=datetime.now(timezone.utc),
-                show_in_nav=False,
-                show_in_footer=False,
-                nav_order=0,
-            )
-            if tips_landing:
-                page.nav_parent_id = tips_landing.id
-
-            # Auto-assign default author if set
-            if site.default_author_id:
-                page.author_id = site.default_author_id
-
-            db.session.add(page)
-            db.session.flush()  # Get page.id
-
-            save_content_to_page(page, content_data, db.session)
+            for fixture, content_data in batch:
+                _add_page(fixture, content_data)
             db.session.commit()
-
-            created_count += 1
-            logger.info('Created tip: %s (fixture %d)', title, fixture_id)
-
-            # Auto-seed comments if enabled
-            if getattr(site, 'comments_enabled', False):
-                try:
-                    from .comment_seeder import seed_comments_for_page
-                    seed_comments_for_page(site_id, slug, title, app=app)
-                except Exception as ce:
-                    logger.warning('Comment seeding failed for %s: %s', slug, ce)
-
-        except RateLimitError:
-            logger.warning('Rate limit reached after creating %d tips', created_count)
-            db.session.rollback()
-            break
+            return batch
         except Exception as e:
-            logger.error('Failed to create tip for %s: %s', title, e)
+            logger.warning('Batch insert of %d tips failed, retrying one by one: %s',
+                           len(batch), e)
             db.session.rollback()
-            continue
 
-    # Step 3: Build site if new pages were created
+        saved = []
+        for fixture, content_data in batch:
+            try:
+                _add_page(fixture, content_data)
+                db.session.commit()
+                saved.append((fixture, content_data))
+            except Exception as e:
+                logger.error('Failed to create tip for %s: %s', _fixture_title(fixture), e)
+                db.session.rollback()
+        return saved
+
+    created = []
+    if fixture_prompts:
+        with ThreadPoolExecutor(max_workers=tips_concurrency) as executor:
+            futures = {
+                executor.submit(_call_api, prompt): item
+                for item, prompt in fixture_prompts
+            }
+            pending = []
+            for future in as_completed(futures):
+                fixture = futures[future]['fixture']
+                try:
+                    pending.append((fixture, future.result()))
+                except Exception as e:
+                    logger.error('Failed to create tip for %s: %s', _fixture_title(fixture), e)
+                    continue
+                if len(pending) >= TIPS_COMMIT_BATCH:
+                    created.extend(_commit_batch(pending))
+                    pending = []
+            if pending:
+                created.extend(_commit_batch(pending))
+
+    for fixture, _ in created:
+        logger.info('Created tip: %s (fixture %d)',
+                    _fixture_title(fixture), fixture.get('fixture', {}).get('id'))
+    created_count = len(created)
+
+    # Auto-seed comments if enabled
+    if created and getattr(site, 'comments_enabled', False):
+        from .comment_seeder import seed_comments_for_page
+        for fixture, _ in created:
+            slug = _fixture_slug(fixture, today)
+            try:
+                seed_comments_for_page(site_id, slug, _fixture_title(fixture), app=app)
+            except Exception as ce:
+                logger.warning('Comment seeding failed for %s: %s', slug, ce)
+
+    # Step 5: Build site if new pages were created
     if created_count > 0:
         logger.info('Created %d new tips for site %d', created_count, site_id)
         try:
@@ -240,7 +367,7 @@ def fetch_and_generate_tips(site_id, app=None):
                 upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads')
 
             # Refresh the site object
-            site = db.session.get(Site, site_id)
+            site = load_site_for_build(site_id)
             build_site(site, output_dir, upload_folder)
             site.current_version += 1
             db.session.commit()
@@ -263,12 +390,29 @@ def fetch_and_generate_tips(site_id, app=None):
 
 
 def run_tips_pipeline_background(app, site_id):
-    """Launch the tips pipeline in a background daemon thread.
+    """Launch the tips pipeline for one site in the background.
+
+    By default this starts scripts/run_tips.py --site-id in its own
+    process, so a long pipeline neither competes with request handlers
+    for the GIL nor dies when the web worker is recycled. With
+    TIPS_IN_PROCESS set it runs in a daemon thread of this process; that
+    is also the default for testing apps, whose config (and database) a
+    separate process would not see.
 
     Args:
         app: Flask app instance
         site_id: Site ID to process
     """
+    if not app.config.get('TIPS_IN_PROCESS', app.testing):
+        project_root = os.path.dirname(app.root_path)
+        subprocess.Popen(
+            [sys.executable, os.path.join(project_root, 'scripts', 'run_tips.py'),
+             '--site-id', str(site_id)],
+            cwd=project_root, start_new_session=True,
+        )
+        logger.info('Tips pipeline started in a separate process for site %d', site_id)
+        return
+
     def _run():
         with app.app_context():
             try:
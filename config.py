@@ -18,6 +18,11 @@ class Config:
     # API-Football (Tips Pipeline)
     API_FOOTBALL_KEY = os.getenv('API_FOOTBALL_KEY', '')
     TIPS_MAX_MATCHES_PER_DAY = int(os.getenv('TIPS_MAX_MATCHES_PER_DAY', '20'))
+    # Fixtures fetched/generated concurrently by the tips pipeline
+    TIPS_CONCURRENCY = int(os.getenv('TIPS_CONCURRENCY', '5'))
+    # Run manually triggered tips pipelines in a thread of the web process
+    # instead of a separate scripts/run_tips.py process (handy in dev)
+    TIPS_IN_PROCESS = os.getenv('TIPS_IN_PROCESS', '').lower() in ('1', 'true', 'yes')
 
     # Comments
     COMMENTS_API_URL = os.getenv('COMMENTS_API_URL', '')
@@ -43,7 +43,7 @@ def main():
         logger.info('Found %d site(s) with odds enabled', len(configs))
 
         from app.services.odds_fetcher import fetch_odds
-        from app.services.site_builder import build_site
+        from app.services.site_builder import build_site, load_site_for_build
         from app.models import db, Site
 
         total_fixtures = 0
@@ -71,6 +71,7 @@ def main():
                 try:
                     output_dir = os.path.join(app.root_path, '..', 'output')
                     upload_folder = app.config.get('UPLOAD_FOLDER', 'uploads')
+                    site = load_site_for_build(site.id)
                     build_site(site, output_dir, upload_folder)
                     site.current_version += 1
                     db.session.commit()
@@ -6,11 +6,13 @@ for all sites that have tips_leagues configured.
 
 Usage:
     python scripts/run_tips.py
+    python scripts/run_tips.py --site-id 3   # one site (used by the admin "run tips" button)
 
 Cron (daily at 6am):
     0 6 * * * cd /opt/aff-web-gen && /opt/aff-web-gen/venv/bin/python scripts/run_tips.py >> /var/log/tips-pipeline.log 2>&1
 """
 
+import argparse
 import logging
 import sys
 import os
@@ -26,7 +28,7 @@ logging.basicConfig(
 logger = logging.getLogger('tips_cron')
 
 
-def main():
+def main(site_id=None):
     from app import create_app
     from app.models import Site
 
@@ -34,7 +36,10 @@ def main():
 
     with app.app_context():
         # Find all sites with tips_leagues configured
-        sites = Site.query.filter(Site.tips_leagues.isnot(None)).all()
+        query = Site.query.filter(Site.tips_leagues.isnot(None))
+        if site_id is not None:
+            query = query.filter(Site.id == site_id)
+        sites = query.all()
 
         if not sites:
             logger.info('No sites have tips_leagues configured — nothing to do')
@@ -58,4 +63,6 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--site-id', type=int, help='only process this site')
+    main(parser.parse_args().site_id)
@@ -1,7 +1,7 @@
 import tempfile
+import threading
 
 import pytest
-from sqlalchemy import event
 
 from app import create_app
 from app.models import db as _db
@@ -20,42 +20,75 @@ def app():
         'SECRET_KEY': 'test-secret',
     })
     with app.app_context():
+        # Flask-SQLAlchemy already gives :memory: a StaticPool, so this is
+        # the one connection every test uses (create_app has opened it, too
+        # late for a 'connect' listener). journal_mode is already MEMORY.
+        with _db.engine.connect() as connection:
+            connection.exec_driver_sql('PRAGMA synchronous=OFF')
+            connection.exec_driver_sql('PRAGMA temp_store=MEMORY')
         seed_all()
         yield app
 
 
-@pytest.fixture(scope='function')
-def db(app):
-    """Provide a clean DB session per test.
+@pytest.fixture(scope='session')
+def _db_conn(app):
+    """One connection and outer transaction shared by every test.
 
-    Wraps each test in a connection-level transaction that is rolled back
-    after the test completes, so route handlers that call db.session.commit()
-    don't leak data between tests.
+    The session is bound to it once for the whole run; per-test isolation
+    comes from the savepoint that the db fixture opens and rolls back.
+    Nothing is ever committed.
     """
     with app.app_context():
-        connection = _db.engine.connect()
+        engines = _db.engines
+        engine = engines[None]
+        connection = engine.connect()
         transaction = connection.begin()
 
-        # Bind the session to this specific connection
-        _db.session.configure(bind=connection)
+        # Flask-SQLAlchemy's Session.get_bind picks the bind from
+        # db.engines and ignores session.configure(bind=...), so the
+        # shared connection is put in the default engine's slot. With
+        # create_savepoint, db.session.commit()/rollback() in route
+        # handlers only end the session's own SAVEPOINT, never the
+        # transaction or the test's savepoint around it.
+        engines[None] = connection
+        _db.session.configure(join_transaction_mode='create_savepoint')
+
+        yield connection
+
+        _db.session.remove()
+        _db.session.configure(join_transaction_mode='conservative_savepoint')
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
+
 
-        # Make db.session.commit() a no-op inside tests — the outer
-        # transaction controls the actual commit/rollback.
-        nested = connection.begin_nested()
+@pytest.fixture(scope='function')
+def db(app, _db_conn):
+    """Provide a clean DB session per test.
 
-        @event.listens_for(_db.session, 'after_transaction_end')
-        def restart_savepoint(session, trans):
-            nonlocal nested
-            if trans.nested and not trans._parent.nested:
-                nested = connection.begin_nested()
+    Each test runs inside a savepoint on the shared connection that is
+    rolled back after the test completes, so route handlers that call
+    db.session.commit() don't leak data between tests.
+    """
+    with app.app_context():
+        # The savepoint must sit inside the shared outer transaction
+        if not _db_conn.in_transaction():
+            _db_conn.begin()
+        nested = _db_conn.begin_nested()
+        threads_before = set(threading.enumerate())
 
         yield _db
 
+        # Background jobs a route started share the connection; let them
+        # finish before the savepoint under them is rolled back
+        for thread in set(threading.enumerate()) - threads_before:
+            if thread.is_alive():
+                thread.join(timeout=30)
+
         # Clean up
         _db.session.remove()
-        event.remove(_db.session, 'after_transaction_end', restart_savepoint)
-        transaction.rollback()
-        connection.close()
+        if nested.is_active:
+            nested.rollback()
 
 
 @pytest.fixture(scope='function')
@@ -2,7 +2,6 @@
 
 import io
 import json
-import uuid
 from unittest.mock import patch
 
 import pytest
@@ -18,30 +17,24 @@ from app.models import (
 @pytest.fixture
 def site_with_brands(db):
     """Create a site with 2 brands assigned, no pages."""
-    uid = uuid.uuid4().hex[:8]
     geo = Geo.query.filter_by(code='au').first()
     vertical = Vertical.query.filter_by(slug='sports-betting').first()
 
     brands = []
     for i, (name, slug) in enumerate([
-        ('BulkBrandA', f'bulk-a-{uid}'),
-        ('BulkBrandB', f'bulk-b-{uid}'),
+        ('BulkBrandA', 'bulk-a'),
+        ('BulkBrandB', 'bulk-b'),
     ]):
         b = Brand(name=name, slug=slug, rating=4.5 - i * 0.5)
-        db.session.add(b)
-        db.session.flush()
-        db.session.add(BrandGeo(brand_id=b.id, geo_id=geo.id,
-                                welcome_bonus=f'${50 - i*10} Free', is_active=True))
-        db.session.add(BrandVertical(brand_id=b.id, vertical_id=vertical.id))
+        b.brand_geos.append(BrandGeo(geo=geo, welcome_bonus=f'${50 - i*10} Free', is_active=True))
+        b.brand_verticals.append(BrandVertical(vertical=vertical))
         brands.append(b)
-    db.session.flush()
 
-    site = Site(name=f'Bulk Test {uid}', geo_id=geo.id, vertical_id=vertical.id, status='draft')
-    db.session.add(site)
-    db.session.flush()
+    site = Site(name='Bulk Test', geo=geo, vertical=vertical, status='draft')
+    site.site_brands = [SiteBrand(brand=b, rank=i + 1) for i, b in enumerate(brands)]
 
-    for i, b in enumerate(brands):
-        db.session.add(SiteBrand(site_id=site.id, brand_id=b.id, rank=i + 1))
+    # One flush; SQLAlchemy orders the INSERTs by dependency
+    db.session.add_all(brands + [site])
     db.session.flush()
 
     return site, brands
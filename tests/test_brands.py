@@ -2,7 +2,6 @@
 
 import io
 import os
-import uuid
 
 from app.models import db as _db, Brand, BrandGeo, BrandVertical, Geo, Vertical
 
@@ -233,10 +232,9 @@ class TestBrandNewFields:
 class TestBulkDeleteBrands:
 
     def test_bulk_delete_multiple(self, client, db):
-        uid = uuid.uuid4().hex[:8]
         brands = []
         for i in range(3):
-            b = Brand(name=f'BulkDel{i}-{uid}', slug=f'bulkdel{i}-{uid}')
+            b = Brand(name=f'BulkDel{i}', slug=f'bulkdel{i}')
             db.session.add(b)
             db.session.flush()
             brands.append(b)
@@ -255,8 +253,7 @@ class TestBulkDeleteBrands:
         assert b'No brands selected' in resp.data
 
     def test_bulk_delete_single(self, client, db):
-        uid = uuid.uuid4().hex[:8]
-        b = Brand(name=f'SingleDel-{uid}', slug=f'singledel-{uid}')
+        b = Brand(name='SingleDel', slug='singledel')
         db.session.add(b)
         db.session.flush()
         bid = b.id
@@ -270,9 +267,8 @@ class TestBulkDeleteBrands:
 
     def test_bulk_delete_with_geos(self, client, db):
         """Bulk delete cascades to brand_geos."""
-        uid = uuid.uuid4().hex[:8]
         geo = Geo.query.filter_by(code='gb').first()
-        b = Brand(name=f'GeoDelB-{uid}', slug=f'geodelb-{uid}')
+        b = Brand(name='GeoDelB', slug='geodelb')
         db.session.add(b)
         db.session.flush()
         bg = BrandGeo(brand_id=b.id, geo_id=geo.id, is_active=True, welcome_bonus='Free')
@@ -4,7 +4,7 @@ ALL OpenAI calls are mocked — no real API calls are ever made in tests.
 """
 
 import json
-import time
+import threading
 import uuid
 from unittest.mock import patch, MagicMock
 
@@ -17,6 +17,7 @@ from app.models import (
 from app.services.content_generator import (
     build_prompt, generate_page_content, save_content_to_page,
     generate_site_content_background, start_generation,
+    PAGE_TYPE_SCHEMAS, model_for_page_type,
 )
 
 
@@ -186,6 +187,42 @@ class TestContentGeneration:
         parsed = json.loads(page.content_json)
         assert parsed['hero_title'] == 'Best Sports Betting Sites in the UK'
 
+    @patch('app.services.content_generator.OpenAI')
+    def test_generation_uses_page_type_schema(self, mock_openai_cls, db):
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = _make_mock_openai_response(MOCK_COMPARISON_RESPONSE)
+
+        site, _ = _create_test_site(db)
+        page = SitePage.query.filter_by(site_id=site.id, slug='comparison').first()
+
+        generate_page_content(page, site, 'fake-key')
+
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        response_format = kwargs['response_format']
+        assert response_format['type'] == 'json_schema'
+        assert response_format['json_schema']['name'] == 'comparison'
+        assert response_format['json_schema']['strict'] is True
+        assert response_format['json_schema']['schema'] is PAGE_TYPE_SCHEMAS['comparison']
+        assert kwargs['model'] == 'gpt-4o-mini'
+
+    def test_schemas_are_strict(self):
+        def _check(node):
+            if node.get('type') == 'object':
+                assert node['additionalProperties'] is False
+                assert set(node['required']) == set(node['properties'])
+                for child in node['properties'].values():
+                    _check(child)
+            elif node.get('type') == 'array':
+                _check(node['items'])
+
+        for schema in PAGE_TYPE_SCHEMAS.values():
+            _check(schema)
+
+    def test_short_page_types_use_smaller_model(self):
+        assert model_for_page_type('bonus-review', 'gpt-4o') == 'gpt-4.1-nano'
+        assert model_for_page_type('brand-review', 'gpt-4o') == 'gpt-4o'
+
 
 # --- 3.3 Evergreen Content ---
 
@@ -291,16 +328,27 @@ class TestBackgroundProcessing:
         site, _ = _create_test_site(db)
         db.session.commit()
 
-        response = client.post(f'/sites/{site.id}/generate')
+        # Hold the background job until this test has read the status:
+        # both sessions share the test connection, so they must not overlap
+        release = threading.Event()
+
+        def _held_generation(*args):
+            release.wait(timeout=10)
+            generate_site_content_background(*args)
+
+        with patch('app.services.content_generator.generate_site_content_background',
+                   _held_generation):
+            response = client.post(f'/sites/{site.id}/generate')
         # Should be a redirect (302), not a long-running request
         assert response.status_code == 302
 
         db.session.expire_all()
         site_refreshed = db.session.get(Site, site.id)
         assert site_refreshed.status == 'generating'
+        db.session.commit()
 
-        # Wait for background thread to finish for cleanup
-        time.sleep(2)
+        # The db fixture waits for the background thread to finish
+        release.set()
 
 
 # --- 3.6 Generation Failure Handling ---
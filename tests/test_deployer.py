@@ -12,7 +12,9 @@ from app.models import (
     db as _db, Site, SiteBrand, SitePage, Geo, Vertical, Brand, BrandGeo,
     BrandVertical, PageType, Domain,
 )
-from app.services.deployer import deploy_site, rollback_site, _prune_releases, MAX_RELEASES
+from app.services.deployer import (
+    deploy_site, rollback_site, _prune_releases, _upload_file, MAX_RELEASES,
+)
 
 
 def _uid():
@@ -117,8 +119,8 @@ def test_deploy_creates_dirs_uploads_and_configures(mock_get_conn, app, db, tmp_
     run_calls = [str(c) for c in mock_conn.run.call_args_list]
     assert any(f'mkdir -p /var/www/sites/{domain_name}/releases/v1' in c for c in run_calls)
 
-    # Verify file upload (put called for index.html + reviews/test.html)
-    assert mock_conn.put.call_count == 2
+    # Verify file upload (sftp open for index.html + reviews/test.html)
+    assert mock_conn.sftp.return_value.open.call_count == 2
 
     # Verify symlink update
     assert any(f'ln -sfn' in c and 'current' in c for c in run_calls)
@@ -217,8 +219,8 @@ def test_rollback_updates_symlink(mock_get_conn, app, db, tmp_path):
     sudo_calls = [str(c) for c in mock_conn.sudo.call_args_list]
     assert any('nginx -s reload' in c for c in sudo_calls)
 
-    # Verify no files uploaded (no put calls)
-    assert mock_conn.put.call_count == 0
+    # Verify no files uploaded (no sftp writes)
+    assert mock_conn.sftp.return_value.open.call_count == 0
 
 
 @patch('app.services.deployer._get_connection')
@@ -409,6 +411,73 @@ def test_deploy_service_exception_propagates(mock_get_conn, app, db, tmp_path):
         deploy_site(site, config)
 
 
+# ── 5.7  File Upload ────────────────────────────────────────────
+
+class _FakeRemoteFile:
+    """Stands in for a paramiko SFTPFile; keeps what was written."""
+
+    def __init__(self):
+        self.data = b''
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def write(self, data):
+        self.data += bytes(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _fake_sftp():
+    sftp = MagicMock()
+    sftp.remote_files = {}
+
+    def _open(path, mode):
+        sftp.remote_files[path] = _FakeRemoteFile()
+        return sftp.remote_files[path]
+
+    sftp.open.side_effect = _open
+    return sftp
+
+
+def test_upload_file_writes_local_bytes(tmp_path):
+    local_path = tmp_path / 'index.html'
+    local_path.write_bytes(b'<html>\xc2\xa3 caf\xc3\xa9</html>\n' * 1000)
+    sftp = _fake_sftp()
+
+    _upload_file(sftp, str(local_path), '/var/www/r/index.html')
+
+    sftp.open.assert_called_once_with('/var/www/r/index.html', 'wb')
+    assert sftp.remote_files['/var/www/r/index.html'].data == local_path.read_bytes()
+
+
+def test_upload_file_creates_empty_remote_file(tmp_path):
+    local_path = tmp_path / 'empty.txt'
+    local_path.write_bytes(b'')
+    sftp = _fake_sftp()
+
+    _upload_file(sftp, str(local_path), '/var/www/r/empty.txt')
+
+    assert sftp.remote_files['/var/www/r/empty.txt'].data == b''
+
+
+@patch('app.services.deployer._get_connection')
+def test_deploy_closes_sftp_when_upload_fails(mock_get_conn, app, db, tmp_path):
+    mock_conn = MagicMock()
+    mock_get_conn.return_value = mock_conn
+    mock_conn.sftp.return_value.open.side_effect = OSError('Permission denied')
+
+    site = _create_built_site(db, tmp_path, domain_name=f'sftpfail-{_uid()}.co.uk')
+
+    with pytest.raises(OSError, match='Permission denied'):
+        deploy_site(site, _make_app_config())
+    mock_conn.sftp.return_value.close.assert_called_once()
+
+
 # ── Route guard tests ──────────────────────────────────────────
 
 def test_deploy_requires_built_status(app, db, client):
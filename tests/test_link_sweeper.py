@@ -0,0 +1,100 @@
+"""Dead internal link sweeper tests.
+
+Tests for:
+- Scanning content_json for links to pages that don't exist
+- Fixing (stripping dead <a> tags, keeping link text)
+"""
+
+import json
+
+import pytest
+
+from app.models import Site, SitePage, Geo, Vertical, PageType
+from app.services.link_sweeper import sweep_dead_links
+
+
+@pytest.fixture
+def sweep_site(db):
+    """A site with a homepage linking to one live and one dead page."""
+    geo = Geo.query.filter_by(code='gb').first()
+    vertical = Vertical.query.filter_by(slug='sports-betting').first()
+
+    site = Site(name='Sweep Site', geo_id=geo.id, vertical_id=vertical.id, status='generated')
+    db.session.add(site)
+    db.session.flush()
+
+    pt_home = PageType.query.filter_by(slug='homepage').first()
+    pt_evergreen = PageType.query.filter_by(slug='evergreen').first()
+
+    db.session.add(SitePage(
+        site_id=site.id, page_type_id=pt_evergreen.id,
+        slug='live-guide', title='Live Guide',
+        content_json=json.dumps({'hero_title': 'Live'}),
+    ))
+    home = SitePage(
+        site_id=site.id, page_type_id=pt_home.id,
+        slug='index', title='Home',
+        content_json=json.dumps({
+            'hero_title': 'Home',
+            'sections': [{
+                'heading': 'Guides',
+                'content': (
+                    'Read the <a href="/live-guide">live guide</a> and the '
+                    '<a href="/gone-guide/?utm=x#top">old guide</a>.'
+                ),
+            }],
+            'faq': [{'question': 'Q?', 'answer': 'See <a href="/gone-guide">here</a>.'}],
+        }),
+    )
+    db.session.add(home)
+    db.session.flush()
+    return site, home
+
+
+class TestSweepScan:
+
+    def test_reports_dead_links_only(self, db, sweep_site):
+        site, home = sweep_site
+        result = sweep_dead_links(site.id)
+
+        assert result['count'] == 2
+        assert {d['link_url'] for d in result['dead_links']} == {'/gone-guide/?utm=x#top', '/gone-guide'}
+        assert {d['field_path'] for d in result['dead_links']} == {'sections[0].content', 'faq[0].answer'}
+        assert result['fixed'] == 0
+
+    def test_missing_site(self, db):
+        result = sweep_dead_links(999999)
+        assert result['count'] == 0
+
+
+class TestSweepFix:
+
+    def test_fix_strips_dead_links_keeps_text(self, db, sweep_site):
+        site, home = sweep_site
+        result = sweep_dead_links(site.id, fix=True)
+
+        assert result['fixed'] == 2
+        assert result['pages_updated'] == 1
+
+        content = json.loads(home.content_json)
+        section = content['sections'][0]['content']
+        assert '<a href="/live-guide">live guide</a>' in section
+        assert 'gone-guide' not in section
+        assert 'old guide' in section
+        assert content['faq'][0]['answer'] == 'See here.'
+
+        # Second sweep finds nothing
+        assert sweep_dead_links(site.id)['count'] == 0
+
+    def test_load_site_for_build_sweeps_first(self, db, sweep_site):
+        from app.services.site_builder import load_site_for_build
+        site, home = sweep_site
+
+        loaded = load_site_for_build(site.id)
+
+        # The graph build_site walks is loaded after the sweep's commit
+        state = db.inspect(loaded)
+        assert 'site_pages' not in state.unloaded
+        page = next(p for p in loaded.site_pages if p.slug == 'index')
+        assert 'content_json' not in db.inspect(page).unloaded
+        assert 'gone-guide' not in page.content_json
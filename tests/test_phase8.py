@@ -13,6 +13,7 @@ import os
 import shutil
 import tempfile
 import uuid
+import zlib
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
 
@@ -24,7 +25,7 @@ from app.models import (
 )
 from app.services.site_builder import build_site
 from app.services.schema_generator import generate_schema
-from app.services.preview_renderer import render_page_preview
+from app.services.preview_renderer import render_page_preview, _author_display
 
 
 # --- Fixture content data ---
@@ -398,6 +399,29 @@ class TestPreviewRenderer:
         html = render_page_preview(page, site)
         assert 'How to Bet' in html
 
+    def test_author_display_colour_is_stable(self):
+        a = _author_display(1, 'Jane Smith', 'jane-smith', 'Editor', '', '', None,
+                            '["Football"]', None)
+        assert a['color'] == f'hsl({zlib.crc32(b"Jane Smith") % 360}, 45%, 45%)'
+        assert a['initials'] == 'JS'
+        assert a['expertise'] == ['Football']
+        assert a['social_links'] == {}
+
+    def test_non_homepage_preview_links_team_page(self, app, p8_site, db):
+        """The footer team link depends on the site having authors, not the page."""
+        from app.models import Author
+        site = p8_site['site']
+        page = p8_site['pages']['review']
+        assert page.author_id is None
+        html = render_page_preview(page, site)
+        assert 'href="/authors/"' not in html
+
+        db.session.add(Author(site_id=site.id, name='Team Writer', slug='team-writer',
+                              is_active=True))
+        db.session.flush()
+        html = render_page_preview(page, site)
+        assert '<a href="/authors/">Our Team</a>' in html
+
     def test_render_bonus_review(self, app, p8_site):
         site = p8_site['site']
         page = p8_site['pages']['bonus']
@@ -596,6 +620,13 @@ class TestSchemaGenerator:
         assert 'FAQPage' not in result
         assert 'WebSite' in result
 
+    def test_null_or_incomplete_faq_skips_faq_schema(self):
+        for faq in (None, [{'question': 'Q?', 'answer': ''}]):
+            result = generate_schema(
+                'homepage', {'faq': faq}, 'Home', 'TestSite', 'test.com', '/index.html')
+            assert 'FAQPage' not in result
+            assert result.count('<script') == 1
+
     def test_schema_in_built_html(self, app, p8_site, db):
         site = p8_site['site']
         output_dir = tempfile.mkdtemp()
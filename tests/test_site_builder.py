@@ -485,3 +485,38 @@ class TestVersionedBuilds:
             assert site.current_version == 2
         finally:
             shutil.rmtree(output_dir, ignore_errors=True)
+
+
+# --- 4.9 Page Writes ---
+
+class TestRenderToFile:
+
+    def test_template_error_leaves_no_partial_page(self, tmp_path):
+        import jinja2
+        from app.services.site_builder import _render_to_file
+
+        env = jinja2.Environment(loader=jinja2.DictLoader({
+            'page.html': '<p>{{ title }}</p>{{ missing.attr }}',
+        }), undefined=jinja2.StrictUndefined)
+        output_file = str(tmp_path / 'page.html')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('previous build')
+
+        with pytest.raises(jinja2.UndefinedError):
+            _render_to_file((env.get_template('page.html'), {}, {'title': 'New'}, output_file))
+
+        assert open(output_file, encoding='utf-8').read() == 'previous build'
+        assert os.listdir(tmp_path) == ['page.html']
+
+    def test_page_keys_win_over_common_context(self, tmp_path):
+        import jinja2
+        from app.services.site_builder import _render_to_file
+
+        env = jinja2.Environment(loader=jinja2.DictLoader({
+            'page.html': '{{ site_name }}|{{ title }}',
+        }))
+        output_file = str(tmp_path / 'page.html')
+        _render_to_file((env.get_template('page.html'), {'site_name': 'Site', 'title': 'Common'},
+                         {'title': 'Page'}, output_file))
+
+        assert open(output_file, encoding='utf-8').read() == 'Site|Page'
@@ -0,0 +1,165 @@
+"""Tips pipeline tests.
+
+API-Football and OpenAI are mocked — no real API calls are ever made in tests.
+"""
+
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.models import Site, SitePage, Geo, Vertical, PageType
+from app.services.tips_pipeline import fetch_and_generate_tips, TIPS_COMMIT_BATCH
+
+
+# --- Helpers ---
+
+def _fixture(fixture_id, home, away, date='2026-10-17T15:00:00+00:00'):
+    """An API-Football fixture as returned by get_fixtures."""
+    return {
+        'fixture': {'id': fixture_id, 'date': date},
+        'teams': {'home': {'name': home}, 'away': {'name': away}},
+    }
+
+
+def _tip_content(prompt, *args, **kwargs):
+    return {'hero_title': 'Match Preview', 'intro_paragraph': prompt[:40]}
+
+
+def _create_tips_site(db, comments_enabled=False):
+    geo = Geo.query.filter_by(code='gb').first()
+    vertical = Vertical.query.filter_by(slug='sports-betting').first()
+    site = Site(
+        name='Tips Test', geo_id=geo.id, vertical_id=vertical.id, status='generated',
+        tips_leagues=json.dumps([{'league_id': 39, 'name': 'Premier League', 'season': 2026}]),
+        comments_enabled=comments_enabled,
+    )
+    db.session.add(site)
+    db.session.commit()
+    return site
+
+
+@pytest.fixture
+def tips_env(app, monkeypatch):
+    """Configure API keys and mock every external call the pipeline makes.
+
+    Yields the mocks so tests can set the fixtures returned and inspect
+    the comment seeding calls.
+    """
+    monkeypatch.setitem(app.config, 'API_FOOTBALL_KEY', 'fake-football-key')
+    monkeypatch.setitem(app.config, 'OPENAI_API_KEY', 'fake-openai-key')
+
+    client = MagicMock()
+    with patch('app.services.api_football.APIFootballClient', return_value=client), \
+            patch('app.services.tips_pipeline._fetch_match_data', return_value='{}'), \
+            patch('app.services.content_generator.call_openai',
+                  side_effect=_tip_content) as call_openai, \
+            patch('app.services.comment_seeder.seed_comments_for_page') as seed_comments, \
+            patch('app.services.site_builder.load_site_for_build') as load_site, \
+            patch('app.services.site_builder.build_site') as build_site:
+        load_site.return_value.status = 'generated'
+        load_site.return_value.current_version = 1
+        yield {
+            'client': client,
+            'call_openai': call_openai,
+            'seed_comments': seed_comments,
+            'build_site': build_site,
+        }
+
+
+# --- Page creation ---
+
+class TestTipsPageCreation:
+
+    def test_creates_one_page_per_fixture_across_batches(self, app, db, tips_env):
+        site = _create_tips_site(db)
+        fixtures = [_fixture(1000 + i, f'Home {i}', f'Away {i}')
+                    for i in range(TIPS_COMMIT_BATCH + 2)]
+        tips_env['client'].get_fixtures.return_value = fixtures
+
+        created = fetch_and_generate_tips(site.id, app=app)
+
+        assert created == len(fixtures)
+        pages = SitePage.query.filter(SitePage.site_id == site.id,
+                                      SitePage.fixture_id.isnot(None)).all()
+        assert sorted(p.fixture_id for p in pages) == [f['fixture']['id'] for f in fixtures]
+        page = next(p for p in pages if p.fixture_id == 1000)
+        assert page.slug == '2026-10-17-home-0-vs-away-0'
+        assert page.evergreen_topic == 'Home 0 vs Away 0'
+        assert page.is_generated
+        assert json.loads(page.content_json)['hero_title'] == 'Match Preview'
+        tips_env['build_site'].assert_called_once()
+
+    def test_rerun_skips_existing_fixtures(self, app, db, tips_env):
+        site = _create_tips_site(db)
+        tips_env['client'].get_fixtures.return_value = [_fixture(2000, 'Spurs', 'Fulham')]
+
+        assert fetch_and_generate_tips(site.id, app=app) == 1
+        assert fetch_and_generate_tips(site.id, app=app) == 0
+        assert tips_env['call_openai'].call_count == 1
+
+    def test_evergreen_clash_falls_back_to_one_commit_per_page(self, app, db, tips_env):
+        site = _create_tips_site(db, comments_enabled=True)
+        # An earlier tip for the same pairing holds the evergreen_topic
+        tips_article = PageType.query.filter_by(slug='tips-article').first()
+        db.session.add(SitePage(
+            site_id=site.id, page_type_id=tips_article.id,
+            evergreen_topic='Arsenal vs Chelsea', slug='2026-03-01-arsenal-vs-chelsea',
+            title='Arsenal vs Chelsea',
+        ))
+        db.session.commit()
+        tips_env['client'].get_fixtures.return_value = [
+            _fixture(3001, 'Leeds', 'Everton'),
+            _fixture(3002, 'Arsenal', 'Chelsea'),
+            _fixture(3003, 'Brentford', 'Wolves'),
+        ]
+
+        created = fetch_and_generate_tips(site.id, app=app)
+
+        assert created == 2
+        saved = {p.fixture_id for p in SitePage.query.filter(
+            SitePage.site_id == site.id, SitePage.fixture_id.isnot(None))}
+        assert saved == {3001, 3003}
+        seeded = sorted(c.args[1] for c in tips_env['seed_comments'].call_args_list)
+        assert seeded == ['2026-10-17-brentford-vs-wolves', '2026-10-17-leeds-vs-everton']
+
+    def test_failed_generation_creates_no_page(self, app, db, tips_env):
+        site = _create_tips_site(db)
+        tips_env['client'].get_fixtures.return_value = [_fixture(4001, 'Bolton', 'Wigan')]
+        tips_env['call_openai'].side_effect = RuntimeError('model unavailable')
+
+        assert fetch_and_generate_tips(site.id, app=app) == 0
+        assert SitePage.query.filter_by(site_id=site.id, fixture_id=4001).first() is None
+        tips_env['build_site'].assert_not_called()
+
+
+# --- Manual trigger route ---
+
+class TestRunTipsRoute:
+
+    def test_testing_app_runs_in_process(self, app, client, db):
+        site = _create_tips_site(db)
+        assert 'TIPS_IN_PROCESS' not in app.config
+
+        with patch('app.services.tips_pipeline.subprocess.Popen') as popen, \
+                patch('app.services.tips_pipeline.threading') as threading:
+            response = client.post(f'/api/sites/{site.id}/run-tips')
+
+        assert response.status_code == 200
+        assert response.get_json()['success'] is True
+        popen.assert_not_called()
+        threading.Thread.return_value.start.assert_called_once()
+
+    def test_separate_process_when_in_process_is_off(self, app, client, db, monkeypatch):
+        site = _create_tips_site(db)
+        monkeypatch.setitem(app.config, 'TIPS_IN_PROCESS', False)
+
+        with patch('app.services.tips_pipeline.subprocess.Popen') as popen, \
+                patch('app.services.tips_pipeline.threading') as threading:
+            response = client.post(f'/api/sites/{site.id}/run-tips')
+
+        assert response.status_code == 200
+        threading.Thread.assert_not_called()
+        args = popen.call_args.args[0]
+        assert args[-2:] == ['--site-id', str(site.id)]
+        assert args[1].endswith('run_tips.py')